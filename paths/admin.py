@@ -3,12 +3,82 @@ Django Admin configuration for Path Library models.
 """
 
 from django.contrib import admin
-from .models import Issue, RootCause, Initiative, Path, Phase, Step, ActionItem, PathComment
+from django.core.paginator import Paginator
+from django.db import connections
+from django.forms.models import BaseInlineFormSet
+from django.utils.functional import cached_property
+from django.urls import reverse
+from django.utils.html import format_html
+from .models import Issue, RootCause, Initiative, Path, Phase, Step, ActionItem, PathComment, ROOT_CAUSE_RANKING
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that reads PostgreSQL's planner estimate for unfiltered changelists
+    instead of running COUNT(*) over the whole table.
+
+    Exact counts are still used for filtered or searched lists, on other databases,
+    and whenever the estimate is small enough that counting is cheap.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.exact_count_threshold:
+                return int(row[0])
+        return super().count
+
+
+class SelectRelatedAdmin(admin.ModelAdmin):
+    """
+    ModelAdmin that joins the ``list_select_related`` foreign keys on every queryset,
+    so ``__str__`` methods that reach into a parent do not issue a query per row.
+    """
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.list_select_related:
+            queryset = queryset.select_related(*self.list_select_related)
+        return queryset
+
+
+def changelist_link(obj, model_name, lookup, label):
+    """Link to the ``model_name`` changelist filtered to rows whose ``lookup`` is ``obj``."""
+    if obj.pk is None:
+        return '-'
+    url = reverse(f'admin:paths_{model_name}_changelist')
+    return format_html('<a href="{}?{}={}">{}</a>', url, lookup, obj.pk, label)
+
+
+class BoundedInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset that renders at most ``max_rows`` existing rows of a large relation.
+
+    The parent admin shows a changelist link (see ``changelist_link``) to reach the rest.
+    """
+    max_rows = 50
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            # Slice here rather than in InlineModelAdmin.get_queryset: the formset
+            # still has to filter by the parent object, which a sliced queryset refuses.
+            self._queryset = super().get_queryset()[:self.max_rows]
+        return self._queryset
 
 
 class RootCauseInline(admin.TabularInline):
     model = RootCause
     extra = 0
+    ordering = ROOT_CAUSE_RANKING
 
 
 class InitiativeInline(admin.TabularInline):
@@ -19,57 +89,67 @@ class InitiativeInline(admin.TabularInline):
 class ActionItemInline(admin.TabularInline):
     model = ActionItem
     extra = 0
+    formset = BoundedInlineFormSet
     fields = ['title', 'status', 'order', 'assignee_id', 'due_date']
 
 
 class StepInline(admin.TabularInline):
     model = Step
     extra = 0
+    formset = BoundedInlineFormSet
     fields = ['title', 'status', 'order']
 
 
 class PhaseInline(admin.TabularInline):
     model = Phase
     extra = 0
+    formset = BoundedInlineFormSet
     fields = ['title', 'status', 'order']
 
 
-class PathCommentInline(admin.TabularInline):
-    model = PathComment
-    extra = 0
-    readonly_fields = ['created_at']
-
-
 @admin.register(Issue)
 class IssueAdmin(admin.ModelAdmin):
     list_display = ['title', 'category', 'priority', 'feedback_count', 'source_channel', 'created_at']
     list_filter = ['priority', 'category', 'source_channel']
-    search_fields = ['title', 'description']
+    search_fields = ['^title']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     inlines = [RootCauseInline]
 
 
 @admin.register(RootCause)
-class RootCauseAdmin(admin.ModelAdmin):
+class RootCauseAdmin(SelectRelatedAdmin):
     list_display = ['title', 'issue', 'cause_category', 'is_ai_generated', 'confidence_score']
+    list_select_related = ['issue']
     list_filter = ['is_ai_generated', 'cause_category']
+    ordering = ROOT_CAUSE_RANKING
     search_fields = ['title', 'description']
     inlines = [InitiativeInline]
 
 
 @admin.register(Initiative)
-class InitiativeAdmin(admin.ModelAdmin):
+class InitiativeAdmin(SelectRelatedAdmin):
     list_display = ['title', 'root_cause', 'initiative_type', 'estimated_effort', 'estimated_impact']
+    list_select_related = ['root_cause']
     list_filter = ['initiative_type', 'estimated_effort', 'estimated_impact', 'is_ai_generated']
     search_fields = ['title', 'description']
 
 
 @admin.register(Path)
-class PathAdmin(admin.ModelAdmin):
+class PathAdmin(SelectRelatedAdmin):
     list_display = ['title', 'status', 'priority', 'progress_percentage', 'owner_id', 'created_at']
     list_filter = ['status', 'priority']
-    search_fields = ['title', 'goal_statement', 'notes']
-    readonly_fields = ['progress_percentage', 'created_at', 'updated_at']
-    inlines = [PhaseInline, PathCommentInline]
+    search_fields = ['^title']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    readonly_fields = ['progress_percentage', 'phases_link', 'comments_link', 'created_at', 'updated_at']
+    inlines = [PhaseInline]
+    # Large text/JSON columns the changelist never renders
+    changelist_deferred_fields = [
+        'goal_statement', 'project_summary', 'baseline_metric', 'current_metric', 'notes',
+        'on_hold_reason', 'what_was_started', 'on_hold_issues_faced',
+        'what_was_solved', 'completed_issues_faced', 'key_learnings',
+    ]
 
     fieldsets = (
         (None, {
@@ -82,13 +162,13 @@ class PathAdmin(admin.ModelAdmin):
             'fields': ('started_at', 'target_completion_date', 'completed_at')
         }),
         ('Progress & Metrics', {
-            'fields': ('progress_percentage', 'baseline_metric', 'current_metric')
+            'fields': ('progress_percentage', 'phases_link', 'baseline_metric', 'current_metric')
         }),
         ('Ownership', {
             'fields': ('organization_id', 'owner_id')
         }),
         ('Notes', {
-            'fields': ('notes',)
+            'fields': ('notes', 'comments_link')
         }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
@@ -96,32 +176,69 @@ class PathAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == 'paths_path_changelist':
+            queryset = queryset.defer(*self.changelist_deferred_fields)
+        return queryset
+
+    @admin.display(description='Comments')
+    def comments_link(self, obj):
+        """Link to the comment changelist filtered to this path, instead of rendering every comment inline."""
+        return changelist_link(obj, 'pathcomment', 'path__id__exact', 'View comments')
+
+    @admin.display(description='All phases')
+    def phases_link(self, obj):
+        """The phase inline stops at BoundedInlineFormSet.max_rows; the changelist has them all."""
+        return changelist_link(obj, 'phase', 'path__id__exact', 'View all phases')
+
 
 @admin.register(Phase)
-class PhaseAdmin(admin.ModelAdmin):
+class PhaseAdmin(SelectRelatedAdmin):
     list_display = ['title', 'path', 'status', 'order']
-    list_filter = ['status', 'path']
-    search_fields = ['title', 'description']
+    list_select_related = ['path']
+    list_filter = ['status', ('path', admin.RelatedOnlyFieldListFilter)]
+    search_fields = ['^title']
+    readonly_fields = ['steps_link']
     inlines = [StepInline]
 
+    @admin.display(description='All steps')
+    def steps_link(self, obj):
+        """The step inline stops at BoundedInlineFormSet.max_rows; the changelist has them all."""
+        return changelist_link(obj, 'step', 'phase__id__exact', 'View all steps')
+
 
 @admin.register(Step)
-class StepAdmin(admin.ModelAdmin):
+class StepAdmin(SelectRelatedAdmin):
     list_display = ['title', 'phase', 'status', 'order']
-    list_filter = ['status', 'phase']
-    search_fields = ['title', 'description']
+    list_select_related = ['phase']
+    list_filter = ['status', ('phase', admin.RelatedOnlyFieldListFilter)]
+    search_fields = ['^title']
+    readonly_fields = ['action_items_link']
     inlines = [ActionItemInline]
 
+    @admin.display(description='All action items')
+    def action_items_link(self, obj):
+        """The action item inline stops at BoundedInlineFormSet.max_rows; the changelist has them all."""
+        return changelist_link(obj, 'actionitem', 'step__id__exact', 'View all action items')
+
 
 @admin.register(ActionItem)
-class ActionItemAdmin(admin.ModelAdmin):
+class ActionItemAdmin(SelectRelatedAdmin):
     list_display = ['title', 'step', 'status', 'order', 'assignee_id', 'due_date']
-    list_filter = ['status', 'step']
-    search_fields = ['title', 'description']
+    list_select_related = ['step']
+    list_filter = ['status', ('step', admin.RelatedOnlyFieldListFilter)]
+    search_fields = ['^title']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 
 @admin.register(PathComment)
-class PathCommentAdmin(admin.ModelAdmin):
+class PathCommentAdmin(SelectRelatedAdmin):
     list_display = ['path', 'author_id', 'created_at']
-    list_filter = ['path']
+    list_select_related = ['path']
+    list_filter = [('path', admin.RelatedOnlyFieldListFilter)]
     search_fields = ['content']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
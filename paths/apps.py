@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class PathsConfig(AppConfig):
     name = 'paths'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -3,27 +3,85 @@ Django Filter classes for the Path Library API.
 """
 
 import django_filters
-from .models import Path, Issue
+from django_filters.fields import BaseCSVField
+from django_filters.rest_framework import DjangoFilterBackend, FilterSet
+from django_filters.widgets import BaseCSVWidget
+from .models import Path, Issue, ActionItem, PathStatus, ItemStatus, Priority
 
+_STATUS_CHOICES = PathStatus.choices
+_PRIORITY_CHOICES = Priority.choices
+_ITEM_STATUS_CHOICES = ItemStatus.choices
 
-class PathFilter(django_filters.FilterSet):
+
+class RepeatableCSVWidget(BaseCSVWidget):
+    """CSV widget that also reads a repeated param, e.g. ``?status=active&status=on_hold``, as one list."""
+
+    def value_from_datadict(self, data, files, name):
+        params = data.getlist(name) if hasattr(data, 'getlist') else []
+        if len(params) > 1:
+            return [value for param in params for value in param.split(',')]
+        return super().value_from_datadict(data, files, name)
+
+
+class RepeatableCSVField(BaseCSVField):
+    base_widget_class = RepeatableCSVWidget
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.ChoiceFilter):
+    """
+    Choice filter compiled to a single IN clause, taking comma-separated values
+    (``?status=active,on_hold``) or the param repeated (``?status=active&status=on_hold``).
+    """
+    base_field_class = RepeatableCSVField
+
+
+class BaseFilterSet(FilterSet):
+    """
+    FilterSet that skips the filter chain entirely when no query params were sent,
+    and builds its form class once per FilterSet rather than once per request.
+    """
+
+    def get_form_class(self):
+        # Declared filters never vary per request here, so the generated form class can be reused.
+        cls = type(self)
+        form_class = cls.__dict__.get('_form_class')
+        if form_class is None:
+            form_class = cls._form_class = super().get_form_class()
+        return form_class
+
+    @property
+    def qs(self):
+        if not self.data:
+            return self.queryset
+        return super().qs
+
+
+class FilterBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend that returns the queryset untouched when no query params were sent,
+    and builds the FilterSet for ``filterset_fields`` views once per view rather than per request.
+    """
+    filterset_base = BaseFilterSet
+    _auto_filtersets = {}
+
+    def get_filterset_class(self, view, queryset=None):
+        if getattr(view, 'filterset_class', None) is not None:
+            return super().get_filterset_class(view, queryset)
+        key = (type(view), getattr(queryset, 'model', None))
+        if key not in self._auto_filtersets:
+            self._auto_filtersets[key] = super().get_filterset_class(view, queryset)
+        return self._auto_filtersets[key]
+
+    def filter_queryset(self, request, queryset, view):
+        if not request.query_params:
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+
+class PathFilter(BaseFilterSet):
     """Filter for Path queryset."""
-    status = django_filters.MultipleChoiceFilter(
-        choices=[
-            ('active', 'Active'),
-            ('on_hold', 'On Hold'),
-            ('completed', 'Completed'),
-            ('archived', 'Archived'),
-        ]
-    )
-    priority = django_filters.MultipleChoiceFilter(
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('critical', 'Critical'),
-        ]
-    )
+    status = CharInFilter(choices=_STATUS_CHOICES)
+    priority = CharInFilter(choices=_PRIORITY_CHOICES)
     organization_id = django_filters.UUIDFilter()
     owner_id = django_filters.UUIDFilter()
 
@@ -44,19 +102,16 @@ class PathFilter(django_filters.FilterSet):
         fields = ['status', 'priority', 'organization_id', 'owner_id', 'issue', 'root_cause', 'initiative']
 
 
-class IssueFilter(django_filters.FilterSet):
+class IssueFilter(BaseFilterSet):
     """Filter for Issue queryset."""
-    priority = django_filters.MultipleChoiceFilter(
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('critical', 'Critical'),
-        ]
-    )
+    priority = CharInFilter(choices=_PRIORITY_CHOICES)
     organization_id = django_filters.UUIDFilter()
+    # On PostgreSQL these infix lookups are served by the pg_trgm indexes from migration 0007
     category = django_filters.CharFilter(lookup_expr='icontains')
     source_channel = django_filters.CharFilter(lookup_expr='icontains')
+    # Anchored variants for pickers/autocomplete; these use the btree prefix indexes from migration 0010
+    category_prefix = django_filters.CharFilter(field_name='category', lookup_expr='istartswith')
+    source_channel_prefix = django_filters.CharFilter(field_name='source_channel', lookup_expr='istartswith')
 
     min_feedback_count = django_filters.NumberFilter(field_name='feedback_count', lookup_expr='gte')
     min_emotional_intensity = django_filters.NumberFilter(field_name='emotional_intensity', lookup_expr='gte')
@@ -67,3 +122,12 @@ class IssueFilter(django_filters.FilterSet):
     class Meta:
         model = Issue
         fields = ['priority', 'organization_id', 'category', 'source_channel']
+
+
+class ActionItemFilter(BaseFilterSet):
+    """Filter for ActionItem queryset."""
+    status = CharInFilter(choices=_ITEM_STATUS_CHOICES)
+
+    class Meta:
+        model = ActionItem
+        fields = ['step', 'status', 'assignee_id']
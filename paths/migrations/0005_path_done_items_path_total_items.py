@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-14 13:15
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_item_counters(apps, schema_editor):
+    Path = apps.get_model('paths', 'Path')
+    ActionItem = apps.get_model('paths', 'ActionItem')
+    counts = ActionItem.objects.values('step__phase__path_id').annotate(
+        total=Count('id'),
+        done=Count('id', filter=Q(status='done')),
+    )
+    for row in counts:
+        Path.objects.filter(pk=row['step__phase__path_id']).update(
+            total_items=row['total'],
+            done_items=row['done'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0004_phase_category_phase_priority_phase_workload_days_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='path',
+            name='done_items',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='path',
+            name='total_items',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_item_counters, migrations.RunPython.noop),
+    ]
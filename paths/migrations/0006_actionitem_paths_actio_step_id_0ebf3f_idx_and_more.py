@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-14 13:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0005_path_done_items_path_total_items'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='actionitem',
+            index=models.Index(fields=['step', 'status'], name='paths_actio_step_id_0ebf3f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='actionitem',
+            index=models.Index(fields=['assignee_id', 'due_date'], name='paths_actio_assigne_04c51c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['organization_id', 'status', '-created_at'], name='paths_path_organiz_9499b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['organization_id', 'target_completion_date'], name='paths_path_organiz_ce1d40_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['progress_percentage'], name='paths_path_progres_8de9c7_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-14 13:20
+
+from django.db import migrations
+
+# IssueFilter matches category/source_channel with icontains, which PostgreSQL runs as
+# UPPER(col::text) LIKE UPPER('%value%'). A pg_trgm GIN index on that same expression
+# lets those lookups use an index instead of a sequential scan.
+TRIGRAM_INDEXES = [
+    ('paths_issue_category_trgm', 'category'),
+    ('paths_issue_source_channel_trgm', 'source_channel'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON paths_issue '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0006_actionitem_paths_actio_step_id_0ebf3f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-14 13:45
+
+import paths.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0007_issue_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='actionitem',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='initiative',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='path',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='pathcomment',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='phase',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='rootcause',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='step',
+            name='id',
+            field=models.UUIDField(default=paths.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-14 14:05
+
+from django.db import migrations
+
+# The admin searches titles with '^title', which PostgreSQL runs as
+# UPPER(title::text) LIKE UPPER('value%'). A btree index on that expression with
+# text_pattern_ops serves the prefix match regardless of the database collation.
+TITLE_PREFIX_INDEXES = [
+    ('paths_issue_title_prefix', 'paths_issue'),
+    ('paths_path_title_prefix', 'paths_path'),
+    ('paths_phase_title_prefix', 'paths_phase'),
+    ('paths_step_title_prefix', 'paths_step'),
+    ('paths_actionitem_title_prefix', 'paths_actionitem'),
+]
+
+
+def create_title_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table in TITLE_PREFIX_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'((UPPER(title::text)) text_pattern_ops)'
+        )
+
+
+def drop_title_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table in TITLE_PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0008_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_prefix_indexes, drop_title_prefix_indexes),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-14 14:20
+
+from django.db import migrations
+
+# IssueFilter's category_prefix/source_channel_prefix use istartswith, which PostgreSQL
+# runs as UPPER(col::text) LIKE UPPER('value%'). A text_pattern_ops btree index on that
+# expression answers the anchored match with a range scan, more cheaply than the trigram index.
+PREFIX_INDEXES = [
+    ('paths_issue_category_prefix', 'category'),
+    ('paths_issue_source_channel_prefix', 'source_channel'),
+]
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in PREFIX_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON paths_issue '
+            f'((UPPER({column}::text)) text_pattern_ops)'
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _column in PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0009_title_prefix_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
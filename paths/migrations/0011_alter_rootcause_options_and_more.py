@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-14 14:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0010_issue_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='rootcause',
+            options={},
+        ),
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['organization_id', '-updated_at'], name='paths_path_organiz_3f5044_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rootcause',
+            index=models.Index(fields=['issue', '-confidence_score', '-created_at'], name='paths_rootc_issue_i_b488d2_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-14 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0011_alter_rootcause_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='path',
+            name='paths_path_owner_i_ce0a07_idx',
+        ),
+        migrations.AddIndex(
+            model_name='actionitem',
+            index=models.Index(fields=['step', 'order', 'created_at'], name='paths_actio_step_id_b0a638_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['owner_id', 'status'], name='paths_path_owner_i_88163f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phase',
+            index=models.Index(fields=['path', 'order', 'created_at'], name='paths_phase_path_id_09d31d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='step',
+            index=models.Index(fields=['phase', 'order', 'created_at'], name='paths_step_phase_i_6dc05c_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-14 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0012_remove_path_paths_path_owner_i_ce0a07_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['-updated_at', '-id'], name='paths_path_updated_5ffa01_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-14 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0013_path_cursor_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rootcause',
+            index=models.Index(condition=models.Q(('is_ai_generated', True)), fields=['-confidence_score', '-created_at'], name='rc_ai_conf_idx'),
+        ),
+    ]
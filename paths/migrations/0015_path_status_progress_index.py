@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-14 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('paths', '0014_rootcause_ai_ranking_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='path',
+            index=models.Index(fields=['status', 'progress_percentage'], name='paths_path_status_efc579_idx'),
+        ),
+    ]
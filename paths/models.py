@@ -10,8 +10,13 @@ Implementation Plan hierarchy:
     - Action Items (individual tasks to complete a step)
 """
 
+import os
+import time
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 
 class PathStatus(models.TextChoices):
@@ -38,9 +43,38 @@ class Priority(models.TextChoices):
     CRITICAL = 'critical', 'Critical'
 
 
+def uuid7():
+    """
+    Return a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new primary keys are
+    appended to the end of the btree index instead of landing on a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def _completion_percentage(action_items):
+    """Return the percentage of done items in an ActionItem queryset, using a single query."""
+    counts = action_items.aggregate(
+        total=Count('id'),
+        done=Count('id', filter=Q(status=ItemStatus.DONE)),
+    )
+    if not counts['total']:
+        return 0
+    return counts['done'] * 100 // counts['total']
+
+
+# Most confident root cause first
+ROOT_CAUSE_RANKING = ['-confidence_score', '-created_at']
+
+
 class BaseModel(models.Model):
     """Abstract base model with common fields."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -48,6 +82,35 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class TracksParentMixin:
+    """
+    Remembers the parent id an object was loaded (or last saved) with.
+
+    paths.signals compares it with the current ``parent_field`` to tell that the object
+    moved to another parent, and so which paths' counters and caches the save affects.
+    Subclasses extend ``_remember_loaded`` to note other stored values the same way.
+    """
+    parent_field = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._remember_loaded()
+
+    def _remember_loaded(self, fields=None):
+        """Note the stored values as loaded or saved; ``fields`` narrows it to a partial load or save."""
+        if fields is None or self.parent_field in fields or self.parent_field[:-3] in fields:
+            # Read from __dict__ so a deferred parent is not fetched here
+            self._orig_parent_id = self.__dict__.get(self.parent_field)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._remember_loaded(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._remember_loaded(fields)
+
+
 class Issue(BaseModel):
     """
     Problem statement extracted from customer feedback.
@@ -115,9 +178,23 @@ class RootCause(BaseModel):
     cause_category = models.CharField(max_length=50, blank=True)
 
     class Meta:
-        ordering = ['-confidence_score', '-created_at']
+        # No default ordering: query sites that rank root causes order by ROOT_CAUSE_RANKING
+        # explicitly, and the indexes below serve the per-issue and AI-only rankings without
+        # a sort step.
+        indexes = [
+            models.Index(fields=['issue', '-confidence_score', '-created_at']),
+            models.Index(
+                fields=['-confidence_score', '-created_at'],
+                condition=Q(is_ai_generated=True),
+                name='rc_ai_conf_idx',
+            ),
+        ]
 
     def __str__(self):
+        return self.title
+
+    def describe(self):
+        """Title with the parent issue for context; reads ``issue``, so join it first."""
         return f"{self.title} (for: {self.issue.title[:30]})"
 
 
@@ -184,6 +261,9 @@ class Path(BaseModel):
 
     # Progress tracking
     progress_percentage = models.PositiveSmallIntegerField(default=0)
+    # Denormalized action item counters, kept in sync by paths.signals
+    total_items = models.PositiveIntegerField(default=0)
+    done_items = models.PositiveIntegerField(default=0)
 
     # Impact measurement
     baseline_metric = models.JSONField(null=True, blank=True)
@@ -210,8 +290,17 @@ class Path(BaseModel):
         verbose_name_plural = 'Paths'
         indexes = [
             models.Index(fields=['organization_id', 'status']),
-            models.Index(fields=['owner_id']),
+            models.Index(fields=['owner_id', 'status']),
             models.Index(fields=['status', 'priority']),
+            # PathFilter range lookups combined with the tenant/status filters
+            models.Index(fields=['organization_id', 'status', '-created_at']),
+            models.Index(fields=['organization_id', 'target_completion_date']),
+            models.Index(fields=['progress_percentage']),
+            # Covers library_stats: its per-status counts and active progress average read only this index
+            models.Index(fields=['status', 'progress_percentage']),
+            # Default -updated_at ordering within a tenant, and the library's cursor pagination
+            models.Index(fields=['organization_id', '-updated_at']),
+            models.Index(fields=['-updated_at', '-id']),
         ]
 
     def __str__(self):
@@ -219,24 +308,41 @@ class Path(BaseModel):
 
     def calculate_progress(self):
         """Calculate progress based on completed action items across all phases."""
-        total_items = 0
-        completed_items = 0
-        for phase in self.phases.all():
-            for step in phase.steps.all():
-                items = step.action_items.all()
-                total_items += items.count()
-                completed_items += items.filter(status=ItemStatus.DONE).count()
-        if total_items == 0:
-            return 0
-        return int((completed_items / total_items) * 100)
+        return _completion_percentage(ActionItem.objects.filter(step__phase__path_id=self.pk))
 
     def update_progress(self):
-        """Update the progress percentage."""
-        self.progress_percentage = self.calculate_progress()
-        self.save(update_fields=['progress_percentage', 'updated_at'])
-
-
-class Phase(BaseModel):
+        """Recount the action item counters from scratch and update the progress percentage."""
+        counts = ActionItem.objects.filter(step__phase__path_id=self.pk).aggregate(
+            total=Count('id'),
+            done=Count('id', filter=Q(status=ItemStatus.DONE)),
+        )
+        self.total_items = counts['total']
+        self.done_items = counts['done']
+        self.progress_percentage = self.done_items * 100 // self.total_items if self.total_items else 0
+        self.save(update_fields=['total_items', 'done_items', 'progress_percentage', 'updated_at'])
+
+    @classmethod
+    def recompute_progress_bulk(cls, path_ids):
+        """
+        Recount the action item counters and progress of many paths in a single UPDATE.
+
+        Use after bulk writes that bypassed the progress signals (bulk_create, queryset.update,
+        or ``save(skip_progress=True)``). ``path_ids`` may be a list or a values('pk') queryset.
+        """
+        per_path = ActionItem.objects.filter(
+            step__phase__path_id=OuterRef('pk')
+        ).order_by().values('step__phase__path_id')
+        total = Subquery(per_path.annotate(n=Count('id')).values('n'))
+        done = Subquery(per_path.annotate(n=Count('id', filter=Q(status=ItemStatus.DONE))).values('n'))
+        return cls.objects.filter(pk__in=path_ids).update(
+            total_items=Coalesce(total, 0),
+            done_items=Coalesce(done, 0),
+            progress_percentage=Coalesce(done * 100 / total, 0, output_field=IntegerField()),
+            updated_at=timezone.now(),
+        )
+
+
+class Phase(TracksParentMixin, BaseModel):
     """
     A major stage in the implementation plan.
 
@@ -246,6 +352,7 @@ class Phase(BaseModel):
     - "Phase 3: Training & Rollout"
     """
     path = models.ForeignKey(Path, on_delete=models.CASCADE, related_name='phases')
+    parent_field = 'path_id'
 
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -275,24 +382,24 @@ class Phase(BaseModel):
 
     class Meta:
         ordering = ['order', 'created_at']
+        indexes = [
+            # Siblings listed in order within their parent
+            models.Index(fields=['path', 'order', 'created_at']),
+        ]
 
     def __str__(self):
+        return self.title
+
+    def describe(self):
+        """Title with the parent path for context; reads ``path``, so join it first."""
         return f"{self.title} ({self.path.title[:20]})"
 
     def calculate_progress(self):
         """Calculate phase progress based on completed action items."""
-        total_items = 0
-        completed_items = 0
-        for step in self.steps.all():
-            items = step.action_items.all()
-            total_items += items.count()
-            completed_items += items.filter(status=ItemStatus.DONE).count()
-        if total_items == 0:
-            return 0
-        return int((completed_items / total_items) * 100)
-
-
-class Step(BaseModel):
+        return _completion_percentage(ActionItem.objects.filter(step__phase_id=self.pk))
+
+
+class Step(TracksParentMixin, BaseModel):
     """
     A specific activity within a phase.
 
@@ -302,6 +409,7 @@ class Step(BaseModel):
     - "Get team input on requirements"
     """
     phase = models.ForeignKey(Phase, on_delete=models.CASCADE, related_name='steps')
+    parent_field = 'phase_id'
 
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -331,20 +439,19 @@ class Step(BaseModel):
 
     class Meta:
         ordering = ['order', 'created_at']
+        indexes = [
+            models.Index(fields=['phase', 'order', 'created_at']),
+        ]
 
     def __str__(self):
         return self.title
 
     def calculate_progress(self):
         """Calculate step progress based on completed action items."""
-        items = self.action_items.all()
-        if not items.exists():
-            return 0
-        completed = items.filter(status=ItemStatus.DONE).count()
-        return int((completed / items.count()) * 100)
+        return _completion_percentage(ActionItem.objects.filter(step_id=self.pk))
 
 
-class ActionItem(BaseModel):
+class ActionItem(TracksParentMixin, BaseModel):
     """
     Individual task to complete a step.
 
@@ -355,6 +462,7 @@ class ActionItem(BaseModel):
     - "Create comparison spreadsheet"
     """
     step = models.ForeignKey(Step, on_delete=models.CASCADE, related_name='action_items')
+    parent_field = 'step_id'
 
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -375,15 +483,82 @@ class ActionItem(BaseModel):
 
     class Meta:
         ordering = ['order', 'created_at']
+        indexes = [
+            models.Index(fields=['step', 'status']),
+            models.Index(fields=['step', 'order', 'created_at']),
+            models.Index(fields=['assignee_id', 'due_date']),
+        ]
 
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
+    def _remember_loaded(self, fields=None):
+        super()._remember_loaded(fields)
+        if fields is None or 'status' in fields:
+            # The stored status the next save expects to replace, see _swap_status
+            self._orig_status = self.__dict__.get('status')
+
+    def save(self, *args, skip_progress=False, **kwargs):
+        """
+        Save the action item; the path's progress counters are updated by paths.signals.
+
+        Outside a transaction a status write to an existing item that stays on its step goes
+        through ``_swap_status`` first, so the signal can shift the counters by the exact delta.
+        Pass ``skip_progress=True`` from bulk loaders and call ``Path.recompute_progress_bulk()`` afterwards.
+        """
+        self._skip_progress = skip_progress
+        self._replaced_status = None
+        update_fields = kwargs.get('update_fields')
+        if not skip_progress and self._writes_status_in_place(update_fields):
+            self._replaced_status = self._swap_status()
+            if self._replaced_status is not None:
+                self._orig_status = self.status
+                kwargs['update_fields'] = self._fields_besides_status(update_fields)
         super().save(*args, **kwargs)
-        # Update path progress when action item is saved
-        if self.step_id and self.step.phase_id and self.step.phase.path_id:
-            self.step.phase.path.update_progress()
+
+    def _fields_besides_status(self, update_fields):
+        """The columns of this save other than ``status``; ``updated_at`` always, so the row write still happens."""
+        fields = {'updated_at'}
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.name == 'status':
+                continue
+            if update_fields is None:
+                written = field.attname in self.__dict__
+            else:
+                written = field.name in update_fields or field.attname in update_fields
+            if written:
+                fields.add(field.attname)
+        return list(fields)
+
+    def _writes_status_in_place(self, update_fields):
+        """Whether this save writes ``status`` of a stored item, outside a transaction and without a move."""
+        if self._state.adding or transaction.get_connection().in_atomic_block:
+            return False
+        if self.__dict__.get('step_id') != self._orig_parent_id:
+            # Moves recount both paths anyway
+            return False
+        if update_fields is None:
+            # A deferred status is not written by a plain save
+            return 'status' in self.__dict__
+        return 'status' in update_fields
+
+    def _swap_status(self):
+        """
+        Write ``status`` with a compare-and-set against the stored value and return the value it replaced.
+
+        Expects the status this copy was loaded with; when another copy was saved in between,
+        re-reads the stored value and tries again. Returns None when the row is gone.
+        """
+        row = ActionItem.objects.filter(pk=self.pk)
+        expected = self._orig_status
+        while True:
+            if expected is None:
+                expected = row.values_list('status', flat=True).first()
+                if expected is None:
+                    return None
+            if row.filter(status=expected).update(status=self.status):
+                return expected
+            expected = None
 
 
 # Keep Task as alias for backward compatibility
@@ -401,4 +576,8 @@ class PathComment(BaseModel):
         ordering = ['-created_at']
 
     def __str__(self):
+        return f"Comment: {self.content[:30]}"
+
+    def describe(self):
+        """Label with the parent path for context; reads ``path``, so join it first."""
         return f"Comment on {self.path.title[:30]}"
@@ -0,0 +1,16 @@
+"""
+Pagination classes for the Path Library API.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class PathCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the path library.
+
+    Each page seeks from the last row's ``updated_at`` via the index instead of
+    scanning and discarding an OFFSET, so deep pages cost the same as the first.
+    """
+    page_size = 40
+    ordering = ('-updated_at', '-id')
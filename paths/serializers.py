@@ -2,11 +2,71 @@
 Serializers for the Path Library API.
 """
 
-from rest_framework import serializers
-from .models import Issue, RootCause, Initiative, Path, Phase, Step, ActionItem, PathComment
-
+import copy
 
-class ActionItemSerializer(serializers.ModelSerializer):
+from rest_framework import serializers
+from .models import (
+    Issue, RootCause, Initiative, Path, Phase, Step, ActionItem, PathComment, PathStatus, ItemStatus,
+    ROOT_CAUSE_RANKING,
+)
+
+_PATH_STATUS_CHOICES = tuple(PathStatus.choices)
+_ITEM_STATUS_CHOICES = tuple(ItemStatus.choices)
+
+# Comments embedded in the path detail; the full history is paginated at /api/comments/?path=<id>
+RECENT_COMMENT_LIMIT = 20
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects its model once per class instead of once per instance.
+
+    ``ModelSerializer.get_fields`` rebuilds every field from the model metadata on each
+    instantiation, although the result only depends on the class. The fields are built on
+    first use and deep-copied afterwards, the way plain Serializers treat declared fields.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            fields = super().get_fields()
+            # Keep an unbound copy; the returned fields get bound to this instance
+            cls._cached_fields = copy.deepcopy(fields)
+            return fields
+        return copy.deepcopy(cached)
+
+
+def _prefetched(obj, relation):
+    """Return the prefetched ``relation`` rows of ``obj``, or None if they were not prefetched."""
+    if relation in getattr(obj, '_prefetched_objects_cache', {}):
+        return getattr(obj, relation).all()
+    return None
+
+
+def _prefetched_phase_items(phase):
+    """Return all action items under a phase from the prefetch cache, or None if any level is missing."""
+    steps = _prefetched(phase, 'steps')
+    if steps is None:
+        return None
+    items = []
+    for step in steps:
+        step_items = _prefetched(step, 'action_items')
+        if step_items is None:
+            return None
+        items.extend(step_items)
+    return items
+
+
+def _done_percentage(rows):
+    """Percentage of ``rows`` whose status is done, matching ``calculate_progress``."""
+    total = len(rows)
+    if not total:
+        return 0
+    return sum(1 for row in rows if row.status == ItemStatus.DONE) * 100 // total
+
+
+class ActionItemSerializer(CachedFieldsModelSerializer):
     """Serializer for ActionItem model."""
 
     class Meta:
@@ -19,7 +79,7 @@ class ActionItemSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class StepSerializer(serializers.ModelSerializer):
+class StepSerializer(CachedFieldsModelSerializer):
     """Serializer for Step model with nested action items."""
     action_items = ActionItemSerializer(many=True, read_only=True)
     progress = serializers.SerializerMethodField()
@@ -39,16 +99,22 @@ class StepSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
     def get_progress(self, obj):
-        return obj.calculate_progress()
+        items = _prefetched(obj, 'action_items')
+        if items is None:
+            return obj.calculate_progress()
+        return _done_percentage(items)
 
     def get_action_items_completed(self, obj):
-        return obj.action_items.filter(status='done').count()
+        items = _prefetched(obj, 'action_items')
+        if items is None:
+            return obj.action_items.filter(status='done').count()
+        return sum(1 for item in items if item.status == ItemStatus.DONE)
 
     def get_action_items_total(self, obj):
         return obj.action_items.count()
 
 
-class PhaseSerializer(serializers.ModelSerializer):
+class PhaseSerializer(CachedFieldsModelSerializer):
     """Serializer for Phase model with nested steps."""
     steps = StepSerializer(many=True, read_only=True)
     progress = serializers.SerializerMethodField()
@@ -68,16 +134,22 @@ class PhaseSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
     def get_progress(self, obj):
-        return obj.calculate_progress()
+        items = _prefetched_phase_items(obj)
+        if items is None:
+            return obj.calculate_progress()
+        return _done_percentage(items)
 
     def get_steps_completed(self, obj):
-        return obj.steps.filter(status='done').count()
+        steps = _prefetched(obj, 'steps')
+        if steps is None:
+            return obj.steps.filter(status='done').count()
+        return sum(1 for step in steps if step.status == ItemStatus.DONE)
 
     def get_steps_total(self, obj):
         return obj.steps.count()
 
 
-class PhaseListSerializer(serializers.ModelSerializer):
+class PhaseListSerializer(CachedFieldsModelSerializer):
     """Lightweight serializer for listing phases."""
     step_count = serializers.SerializerMethodField()
     progress = serializers.SerializerMethodField()
@@ -94,10 +166,13 @@ class PhaseListSerializer(serializers.ModelSerializer):
         return obj.steps.count()
 
     def get_progress(self, obj):
-        return obj.calculate_progress()
+        items = _prefetched_phase_items(obj)
+        if items is None:
+            return obj.calculate_progress()
+        return _done_percentage(items)
 
 
-class PathCommentSerializer(serializers.ModelSerializer):
+class PathCommentSerializer(CachedFieldsModelSerializer):
     """Serializer for PathComment model."""
 
     class Meta:
@@ -106,7 +181,7 @@ class PathCommentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class InitiativeSerializer(serializers.ModelSerializer):
+class InitiativeSerializer(CachedFieldsModelSerializer):
     """Serializer for Initiative model."""
 
     class Meta:
@@ -119,7 +194,7 @@ class InitiativeSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class InitiativeListSerializer(serializers.ModelSerializer):
+class InitiativeListSerializer(CachedFieldsModelSerializer):
     """Lightweight serializer for listing initiatives."""
 
     class Meta:
@@ -127,7 +202,7 @@ class InitiativeListSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'initiative_type', 'estimated_effort', 'estimated_impact']
 
 
-class RootCauseSerializer(serializers.ModelSerializer):
+class RootCauseSerializer(CachedFieldsModelSerializer):
     """Serializer for RootCause model."""
     initiatives = InitiativeListSerializer(many=True, read_only=True)
 
@@ -141,7 +216,7 @@ class RootCauseSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class RootCauseListSerializer(serializers.ModelSerializer):
+class RootCauseListSerializer(CachedFieldsModelSerializer):
     """Lightweight serializer for listing root causes."""
 
     class Meta:
@@ -149,9 +224,9 @@ class RootCauseListSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'cause_category', 'is_ai_generated', 'confidence_score']
 
 
-class IssueSerializer(serializers.ModelSerializer):
+class IssueSerializer(CachedFieldsModelSerializer):
     """Serializer for Issue model."""
-    root_causes = RootCauseListSerializer(many=True, read_only=True)
+    root_causes = serializers.SerializerMethodField()
 
     class Meta:
         model = Issue
@@ -162,8 +237,15 @@ class IssueSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    def get_root_causes(self, obj):
+        root_causes = obj.root_causes.all()
+        if 'root_causes' not in getattr(obj, '_prefetched_objects_cache', {}):
+            # Prefetches are expected to be ordered by ROOT_CAUSE_RANKING already
+            root_causes = root_causes.order_by(*ROOT_CAUSE_RANKING)
+        return RootCauseListSerializer(root_causes, many=True, context=self.context).data
+
 
-class IssueListSerializer(serializers.ModelSerializer):
+class IssueListSerializer(CachedFieldsModelSerializer):
     """Lightweight serializer for listing issues."""
 
     class Meta:
@@ -171,51 +253,42 @@ class IssueListSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'category', 'priority', 'feedback_count']
 
 
-class PathListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for listing paths in the library."""
-    issue_title = serializers.CharField(source='issue.title', read_only=True)
-    root_cause_title = serializers.CharField(source='root_cause.title', read_only=True)
-    initiative_title = serializers.CharField(source='initiative.title', read_only=True)
-    phase_count = serializers.SerializerMethodField()
-    action_item_count = serializers.SerializerMethodField()
-    completed_action_count = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Path
-        fields = [
-            'id', 'title', 'status', 'priority', 'progress_percentage',
-            'issue_title', 'root_cause_title', 'initiative_title',
-            'phase_count', 'action_item_count', 'completed_action_count',
-            'started_at', 'target_completion_date', 'completed_at', 'paused_at',
-            'team_size', 'duration_days', 'project_summary',
-            'created_at', 'updated_at'
-        ]
-
-    def get_phase_count(self, obj):
-        return obj.phases.count()
-
-    def get_action_item_count(self, obj):
-        count = 0
-        for phase in obj.phases.all():
-            for step in phase.steps.all():
-                count += step.action_items.count()
-        return count
-
-    def get_completed_action_count(self, obj):
-        count = 0
-        for phase in obj.phases.all():
-            for step in phase.steps.all():
-                count += step.action_items.filter(status='done').count()
-        return count
-
-
-class PathDetailSerializer(serializers.ModelSerializer):
+class PathListSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for listing paths in the library.
+
+    Reads the dict rows projected by ``PathViewSet.get_queryset`` for the list action,
+    so no model instances are built for a list page.
+    """
+    id = serializers.UUIDField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    priority = serializers.CharField(read_only=True)
+    progress_percentage = serializers.IntegerField(read_only=True)
+    issue_title = serializers.CharField(read_only=True)
+    root_cause_title = serializers.CharField(read_only=True)
+    initiative_title = serializers.CharField(read_only=True)
+    phase_count = serializers.IntegerField(read_only=True)
+    action_item_count = serializers.IntegerField(read_only=True)
+    completed_action_count = serializers.IntegerField(read_only=True)
+    started_at = serializers.DateTimeField(read_only=True)
+    target_completion_date = serializers.DateField(read_only=True)
+    completed_at = serializers.DateTimeField(read_only=True)
+    paused_at = serializers.DateTimeField(read_only=True)
+    team_size = serializers.IntegerField(read_only=True)
+    duration_days = serializers.IntegerField(read_only=True)
+    project_summary = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+
+class PathDetailSerializer(CachedFieldsModelSerializer):
     """Detailed serializer for a single path with all related data."""
     issue = IssueSerializer(read_only=True)
     root_cause = RootCauseSerializer(read_only=True)
     initiative = InitiativeSerializer(read_only=True)
     phases = PhaseSerializer(many=True, read_only=True)
-    comments = PathCommentSerializer(many=True, read_only=True)
+    comments = serializers.SerializerMethodField()
 
     class Meta:
         model = Path
@@ -234,8 +307,14 @@ class PathDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'progress_percentage', 'created_at', 'updated_at']
 
+    def get_comments(self, obj):
+        comments = getattr(obj, 'recent_comments', None)
+        if comments is None:
+            comments = obj.comments.order_by('-created_at')[:RECENT_COMMENT_LIMIT]
+        return PathCommentSerializer(comments, many=True, context=self.context).data
 
-class PathCreateSerializer(serializers.ModelSerializer):
+
+class PathCreateSerializer(CachedFieldsModelSerializer):
     """Serializer for creating a new path."""
 
     class Meta:
@@ -249,7 +328,7 @@ class PathCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class PathUpdateSerializer(serializers.ModelSerializer):
+class PathUpdateSerializer(CachedFieldsModelSerializer):
     """Serializer for updating a path."""
 
     class Meta:
@@ -268,19 +347,39 @@ class PathUpdateSerializer(serializers.ModelSerializer):
 
 class PathStatusUpdateSerializer(serializers.Serializer):
     """Serializer for updating path status."""
-    status = serializers.ChoiceField(choices=[
-        ('active', 'Active'),
-        ('on_hold', 'On Hold'),
-        ('completed', 'Completed'),
-        ('archived', 'Archived'),
-    ])
+    status = serializers.ChoiceField(choices=_PATH_STATUS_CHOICES)
+
+
+class PathStatusResponseSerializer(CachedFieldsModelSerializer):
+    """The status and lifecycle fields returned after a path status update."""
+
+    class Meta:
+        model = Path
+        fields = ['id', 'status', 'progress_percentage', 'started_at', 'paused_at', 'completed_at', 'updated_at']
+        read_only_fields = fields
 
 
 class ActionItemStatusSerializer(serializers.Serializer):
     """Serializer for updating action item status."""
-    status = serializers.ChoiceField(choices=[
-        ('todo', 'To Do'),
-        ('in_progress', 'In Progress'),
-        ('blocked', 'Blocked'),
-        ('done', 'Done'),
-    ])
+    status = serializers.ChoiceField(choices=_ITEM_STATUS_CHOICES)
+
+
+class ActionItemBulkStatusEntrySerializer(ActionItemStatusSerializer):
+    """One action item and its new status in a bulk status update."""
+    id = serializers.UUIDField()
+
+
+class ActionItemBulkStatusSerializer(serializers.Serializer):
+    """Serializer for updating the status of many action items at once."""
+    items = ActionItemBulkStatusEntrySerializer(many=True, allow_empty=False)
+
+    def validate_items(self, items):
+        ids = [entry['id'] for entry in items]
+        if len(set(ids)) != len(ids):
+            raise serializers.ValidationError("Each action item may only be listed once.")
+        return items
+
+
+class MoveSerializer(serializers.Serializer):
+    """Serializer for moving a phase, step or action item among its siblings."""
+    after = serializers.UUIDField(allow_null=True, required=False, help_text="Sibling to place after; null moves to the top")
@@ -0,0 +1,217 @@
+"""
+Signal handlers that keep the denormalized Path progress counters in sync.
+
+Outside a transaction a created action item turns into a single UPDATE of its
+path that shifts ``total_items``/``done_items`` by a delta and derives
+``progress_percentage`` from the new values. A status change does the same:
+``ActionItem.save`` writes the status with a compare-and-set against the stored
+row, so the delta is taken from the status it actually replaced, never from a
+stale copy. Items, phases and steps moved to another parent recount both paths.
+
+Inside ``transaction.atomic()`` (bulk edits, cascading deletes) the touched paths
+are only remembered, and recounted once with a single UPDATE when the transaction
+commits, however many items changed.
+
+Every write to a path's plan (phases, steps, action items) also bumps the path's
+``updated_at``, which versions the cached ``ai_query`` context of that path.
+Changes to a path's status or progress retire the cached ``library_stats`` responses.
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+from django.db import transaction
+from django.db.models import Case, F, PositiveSmallIntegerField, Q, When
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import ActionItem, ItemStatus, Path, Phase, Step
+
+# Cache key of the version every cached library_stats response is keyed under
+LIBRARY_STATS_VERSION_KEY = 'libstats:version'
+
+
+def _paths_for_step(step_id):
+    """Queryset matching the path that owns ``step_id``."""
+    return Path.objects.filter(phases__steps__id=step_id)
+
+
+def bump_library_stats_version():
+    """Start a new library_stats cache version, after a path status or progress change, and return it."""
+    # A fresh random value, so an evicted version key can never bring back old entries
+    version = uuid.uuid4().hex
+    cache.set(LIBRARY_STATS_VERSION_KEY, version, None)
+    return version
+
+
+def touch_paths(paths):
+    """Bump ``updated_at`` on ``paths`` after a plan change that leaves the counters alone."""
+    paths.update(updated_at=timezone.now())
+
+
+def apply_progress_delta(paths, delta_total, delta_done):
+    """Shift the action item counters of ``paths`` and recompute progress in one UPDATE."""
+    if not delta_total and not delta_done:
+        touch_paths(paths)
+        return
+    new_total = F('total_items') + delta_total
+    new_done = F('done_items') + delta_done
+    paths.update(
+        total_items=new_total,
+        done_items=new_done,
+        # The right-hand side of an UPDATE sees the old row, so derive progress from the new counts
+        progress_percentage=Case(
+            When(total_items__gt=-delta_total, then=new_done * 100 / new_total),
+            default=0,
+            output_field=PositiveSmallIntegerField(),
+        ),
+        updated_at=timezone.now(),
+    )
+    bump_library_stats_version()
+
+
+def _pending_progress():
+    """Path and step ids on the current connection waiting for a recount at commit."""
+    connection = transaction.get_connection()
+    pending = getattr(connection, '_pending_progress', None)
+    if pending is None:
+        pending = connection._pending_progress = {'paths': set(), 'steps': set(), 'step_paths': {}}
+    return pending
+
+
+def _path_id_for_step(step_id):
+    """Id of the path owning ``step_id``, cached on the connection until the next flush."""
+    step_paths = _pending_progress()['step_paths']
+    if step_id not in step_paths:
+        step_paths[step_id] = _paths_for_step(step_id).values_list('pk', flat=True).first()
+    return step_paths[step_id]
+
+
+def defer_progress_recount(path_ids=(), step_ids=()):
+    """Recount the given paths (and the paths owning ``step_ids``) when the transaction commits."""
+    pending = _pending_progress()
+    pending['paths'].update(path_id for path_id in path_ids if path_id is not None)
+    pending['steps'].update(step_ids)
+    # Registered per write: callbacks from a rolled back savepoint are dropped, and
+    # every callback after the first finds the pending sets already flushed.
+    transaction.on_commit(flush_progress_recount)
+
+
+def flush_progress_recount():
+    """Recount every path collected by ``defer_progress_recount`` in a single UPDATE."""
+    pending = _pending_progress()
+    path_ids, step_ids = pending['paths'], pending['steps']
+    if not path_ids and not step_ids:
+        return
+    pending['paths'], pending['steps'], pending['step_paths'] = set(), set(), {}
+    Path.recompute_progress_bulk(
+        Path.objects.filter(Q(pk__in=path_ids) | Q(phases__steps__id__in=step_ids)).values('pk')
+    )
+    bump_library_stats_version()
+
+
+def _recount_paths(paths):
+    """Recount ``paths`` now, or when the transaction commits if one is open."""
+    if transaction.get_connection().in_atomic_block:
+        defer_progress_recount(path_ids=set(paths.values_list('pk', flat=True)))
+        return
+    Path.recompute_progress_bulk(paths.values('pk'))
+    bump_library_stats_version()
+
+
+# Action item fields whose change can move a path's counters
+PROGRESS_FIELDS = {'status', 'step', 'step_id'}
+
+
+@receiver(post_save, sender=ActionItem)
+def action_item_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Shift the counters for a created or re-statused action item, recount for a moved one."""
+    if raw or instance._skip_progress:
+        return
+
+    step_ids = {instance.step_id, instance._orig_parent_id} - {None}
+    if transaction.get_connection().in_atomic_block:
+        defer_progress_recount(step_ids=step_ids)
+        return
+
+    if created:
+        apply_progress_delta(_paths_for_step(instance.step_id), 1, int(instance.status == ItemStatus.DONE))
+        return
+
+    replaced = instance._replaced_status
+    if replaced is not None:
+        # save() swapped the status in over the stored value, so this delta is exact
+        delta_done = int(instance.status == ItemStatus.DONE) - int(replaced == ItemStatus.DONE)
+        apply_progress_delta(_paths_for_step(instance.step_id), 0, delta_done)
+        return
+
+    if update_fields is not None and not PROGRESS_FIELDS & set(update_fields):
+        touch_paths(_paths_for_step(instance.step_id))
+        return
+
+    # The old path too when the item moved to another step
+    Path.recompute_progress_bulk(Path.objects.filter(phases__steps__id__in=step_ids).values('pk'))
+    bump_library_stats_version()
+
+
+@receiver(post_delete, sender=ActionItem)
+def action_item_deleted(sender, instance, origin=None, **kwargs):
+    """
+    Recount the deleted action item's path once the delete commits.
+
+    Deletes always run inside the collector's transaction, so a cascade of many items
+    ends in one recount per path rather than one UPDATE per item.
+    """
+    if isinstance(origin, Path):
+        # The path itself is being deleted
+        return
+    if isinstance(origin, Phase):
+        path_id = origin.path_id
+    elif isinstance(origin, Step):
+        path_id = origin.phase.path_id
+    else:
+        # The step may be deleted in the same cascade, so resolve its path now
+        path_id = _path_id_for_step(instance.step_id)
+    defer_progress_recount(path_ids=[path_id])
+
+
+@receiver(post_save, sender=Path)
+@receiver(post_delete, sender=Path)
+def path_changed(sender, instance, raw=False, **kwargs):
+    """Retire the cached library_stats responses for a saved or deleted path."""
+    if raw:
+        return
+    bump_library_stats_version()
+
+
+@receiver(post_save, sender=Phase)
+@receiver(post_delete, sender=Phase)
+def phase_changed(sender, instance, raw=False, origin=None, **kwargs):
+    """Bump the owning path's ``updated_at`` for a saved or deleted phase; recount both paths of a move."""
+    if raw or isinstance(origin, Path):
+        return
+    path_ids = {instance._orig_parent_id, instance.path_id} - {None}
+    paths = Path.objects.filter(pk__in=path_ids)
+    if len(path_ids) > 1:
+        # Moved to another path: its action items leave one path's counters for the other's
+        _recount_paths(paths)
+    else:
+        touch_paths(paths)
+
+
+@receiver(post_save, sender=Step)
+@receiver(post_delete, sender=Step)
+def step_changed(sender, instance, raw=False, origin=None, **kwargs):
+    """Bump the owning path's ``updated_at`` for a saved or deleted step; recount both paths of a move."""
+    if raw or isinstance(origin, (Path, Phase)):
+        # The path is going away, or the deleted phase touches it itself
+        return
+    phase_ids = {instance._orig_parent_id, instance.phase_id} - {None}
+    paths = Path.objects.filter(phases__id__in=phase_ids)
+    if len(phase_ids) > 1:
+        # Moved to another phase, possibly of another path
+        _recount_paths(paths)
+    else:
+        touch_paths(paths)
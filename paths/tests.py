@@ -1,3 +1,32 @@
+from django.http import QueryDict
 from django.test import TestCase
 
-# Create your tests here.
+from .filters import ActionItemFilter, PathFilter
+from .models import ItemStatus, Path, PathStatus
+
+
+class CharInFilterTests(TestCase):
+    def clean(self, filterset_class, query):
+        filterset = filterset_class(data=QueryDict(query), queryset=filterset_class._meta.model.objects.none())
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return filterset.form.cleaned_data
+
+    def test_comma_separated_values(self):
+        cleaned = self.clean(PathFilter, 'status=active,on_hold')
+        self.assertEqual(cleaned['status'], [PathStatus.ACTIVE, PathStatus.ON_HOLD])
+
+    def test_repeated_param(self):
+        cleaned = self.clean(PathFilter, 'status=active&status=on_hold')
+        self.assertEqual(cleaned['status'], [PathStatus.ACTIVE, PathStatus.ON_HOLD])
+
+    def test_repeated_and_comma_separated_values_combine(self):
+        cleaned = self.clean(ActionItemFilter, 'status=todo,in_progress&status=done')
+        self.assertEqual(cleaned['status'], [ItemStatus.TODO, ItemStatus.IN_PROGRESS, ItemStatus.DONE])
+
+    def test_single_value(self):
+        self.assertEqual(self.clean(PathFilter, 'status=active')['status'], [PathStatus.ACTIVE])
+
+    def test_invalid_repeated_value_is_rejected(self):
+        filterset = PathFilter(data=QueryDict('status=active&status=bogus'), queryset=Path.objects.none())
+        self.assertFalse(filterset.is_valid())
+        self.assertIn('status', filterset.errors)
@@ -2,33 +2,67 @@
 API Views for the Path Library.
 """
 
+import hashlib
+import re
+from collections import defaultdict
+from operator import itemgetter
 from datetime import date, timedelta
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, RowNumber
 from django.utils import timezone
+from django.utils.http import urlencode
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Issue, RootCause, Initiative, Path, Phase, Step, ActionItem, PathComment, PathStatus, ItemStatus
+from .models import (
+    Issue, RootCause, Initiative, Path, Phase, Step, ActionItem, PathComment, PathStatus, ItemStatus,
+    ROOT_CAUSE_RANKING,
+)
 from .serializers import (
     IssueSerializer, IssueListSerializer,
     RootCauseSerializer, RootCauseListSerializer,
     InitiativeSerializer, InitiativeListSerializer,
     PathListSerializer, PathDetailSerializer, PathCreateSerializer, PathUpdateSerializer,
-    PathStatusUpdateSerializer, ActionItemStatusSerializer,
+    PathStatusUpdateSerializer, PathStatusResponseSerializer, ActionItemStatusSerializer, ActionItemBulkStatusSerializer, MoveSerializer,
     PhaseSerializer, PhaseListSerializer,
     StepSerializer,
     ActionItemSerializer,
-    PathCommentSerializer,
+    PathCommentSerializer, RECENT_COMMENT_LIMIT,
 )
-from .filters import PathFilter, IssueFilter
+from .filters import FilterBackend, PathFilter, IssueFilter, ActionItemFilter
+from .pagination import PathCursorPagination
+from .signals import LIBRARY_STATS_VERSION_KEY, bump_library_stats_version, touch_paths
+
+# How long an ai_query context or answer stays cached; its key changes whenever the path's plan does
+AI_CONTEXT_CACHE_SECONDS = 300
+
+# How long a library_stats response stays cached; path status and progress changes retire it sooner
+LIBRARY_STATS_CACHE_SECONDS = 45
+
+
+class ListQuerysetMixin:
+    """
+    Serve the list action from ``list_queryset`` instead of ``queryset``.
+
+    List serializers render a handful of columns, so the list queryset can
+    ``only()`` those and skip the joins and prefetches the detail view needs.
+    """
+    list_queryset = None
+
+    def get_queryset(self):
+        if self.action == 'list' and self.list_queryset is not None:
+            return self.list_queryset.all()
+        return super().get_queryset()
 
 
-class IssueViewSet(viewsets.ModelViewSet):
+class IssueViewSet(ListQuerysetMixin, viewsets.ModelViewSet):
     """API endpoint for Issues."""
     queryset = Issue.objects.all()
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    list_queryset = Issue.objects.only('id', 'title', 'category', 'priority', 'feedback_count')
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = IssueFilter
     search_fields = ['title', 'description', 'category']
     ordering_fields = ['created_at', 'priority', 'feedback_count', 'emotional_intensity']
@@ -40,14 +74,18 @@ class IssueViewSet(viewsets.ModelViewSet):
         return IssueSerializer
 
 
-class RootCauseViewSet(viewsets.ModelViewSet):
+class RootCauseViewSet(ListQuerysetMixin, viewsets.ModelViewSet):
     """API endpoint for Root Causes."""
-    queryset = RootCause.objects.select_related('issue').prefetch_related('initiatives')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    # The issue is rendered as its id; only the nested initiatives need loading
+    queryset = RootCause.objects.prefetch_related('initiatives')
+    list_queryset = RootCause.objects.only(
+        'id', 'title', 'cause_category', 'is_ai_generated', 'confidence_score'
+    )
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['issue', 'is_ai_generated', 'cause_category']
     search_fields = ['title', 'description']
     ordering_fields = ['created_at', 'confidence_score']
-    ordering = ['-confidence_score', '-created_at']
+    ordering = ROOT_CAUSE_RANKING
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -55,10 +93,14 @@ class RootCauseViewSet(viewsets.ModelViewSet):
         return RootCauseSerializer
 
 
-class InitiativeViewSet(viewsets.ModelViewSet):
+class InitiativeViewSet(ListQuerysetMixin, viewsets.ModelViewSet):
     """API endpoint for Initiatives."""
-    queryset = Initiative.objects.select_related('root_cause', 'root_cause__issue')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    # InitiativeSerializer renders the root cause as its id, so nothing is joined
+    queryset = Initiative.objects.all()
+    list_queryset = Initiative.objects.only(
+        'id', 'title', 'initiative_type', 'estimated_effort', 'estimated_impact'
+    )
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['root_cause', 'initiative_type', 'estimated_effort', 'estimated_impact', 'is_ai_generated']
     search_fields = ['title', 'description']
     ordering_fields = ['created_at', 'estimated_impact']
@@ -70,6 +112,160 @@ class InitiativeViewSet(viewsets.ModelViewSet):
         return InitiativeSerializer
 
 
+def _path_count(model, path_lookup, **filters):
+    """Correlated COUNT(*) subquery over ``model`` rows that belong to the outer Path."""
+    rows = model.objects.filter(**{path_lookup: models.OuterRef('pk')}, **filters).order_by().values(path_lookup)
+    return Coalesce(models.Subquery(rows.annotate(count=models.Count('pk')).values('count')), 0)
+
+
+def _phase_tree_prefetch():
+    """Prefetch a path's phases, steps and action items, each level in its sibling order."""
+    return models.Prefetch(
+        'phases',
+        queryset=Phase.objects.order_by('order', 'created_at').prefetch_related(
+            models.Prefetch(
+                'steps',
+                queryset=Step.objects.order_by('order', 'created_at').prefetch_related(
+                    models.Prefetch('action_items', queryset=ActionItem.objects.order_by('order', 'created_at')),
+                ),
+            ),
+        ),
+    )
+
+
+# Sibling order of phases, steps and action items, and of action items across the whole plan
+SIBLING_ORDER = ('order', 'created_at')
+PLAN_ORDER = ('step__phase__order', 'step__phase__created_at', 'step__order', 'step__created_at', 'order', 'created_at')
+
+
+# How many items an ai_query answer lists before summarising the rest as a count
+AI_PREVIEW_LIMIT = 5
+
+
+def _ellipsize(text, limit):
+    """``text`` cut to its first ``limit`` characters, with an ellipsis when it was longer."""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+# Topics listed under every default ai_query answer
+AI_DEFAULT_FOOTER = (
+    "💡 **Ask me about:**\n"
+    "• Status & progress\n"
+    "• Blockers & risks\n"
+    "• Deadlines & timeline\n"
+    "• Team & workload\n"
+    "• Phases & steps\n"
+    "• Goal & purpose\n"
+    "• Issue & root cause\n"
+    "• Accomplishments\n"
+    "• Recommendations\n"
+    "• Full summary"
+)
+
+# Recommendation priorities (high, medium, low) index their marker
+PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW = range(3)
+_PRIORITY_EMOJI = ("🔴", "🟡", "🟢")
+
+
+def _pending_items(path):
+    """The path's unfinished action items."""
+    return ActionItem.objects.filter(step__phase__path=path).exclude(status=ItemStatus.DONE)
+
+
+def _due_bucket(today):
+    """Urgency of a pending item's due date: overdue, due within a week, or later."""
+    return models.Case(
+        models.When(due_date__lt=today, then=models.Value('overdue')),
+        models.When(due_date__lte=today + timedelta(days=7), then=models.Value('this_week')),
+        default=models.Value('later'),
+    )
+
+
+def _pending_item_counts(path, today):
+    """Count the path's pending items per urgency bucket, plus the gaps the recommendations flag."""
+    week_end = today + timedelta(days=7)
+    not_blocked = ~models.Q(status=ItemStatus.BLOCKED)
+    return _pending_items(path).aggregate(
+        overdue=models.Count('id', filter=models.Q(due_date__lt=today)),
+        this_week=models.Count('id', filter=models.Q(due_date__gte=today, due_date__lte=week_end)),
+        later=models.Count('id', filter=models.Q(due_date__gt=week_end)),
+        # In progress or to do, without an owner or a due date
+        open_unassigned=models.Count('id', filter=not_blocked & models.Q(assignee_name='')),
+        open_undated=models.Count('id', filter=not_blocked & models.Q(due_date__isnull=True)),
+        earliest_due=models.Min('due_date'),
+        latest_due=models.Max('due_date'),
+    )
+
+
+def _ranked_previews(items, group, order_by):
+    """
+    The first AI_PREVIEW_LIMIT ``items`` rows per value of the ``group`` field or annotation,
+    in ``order_by`` order, keyed by that value.
+
+    One query: a ROW_NUMBER() window ranks the rows within their group and the outer
+    query keeps the top ranks.
+    """
+    fields = ['title', 'status', 'assignee_name', 'due_date', 'phase_title', 'step_title']
+    if group not in fields:
+        fields.append(group)
+    rows = (
+        items.annotate(
+            phase_title=models.F('step__phase__title'),
+            step_title=models.F('step__title'),
+            preview_rank=models.Window(
+                RowNumber(),
+                partition_by=models.F(group),
+                order_by=[models.F(field).asc() for field in order_by],
+            ),
+        )
+        .filter(preview_rank__lte=AI_PREVIEW_LIMIT)
+        .values('preview_rank', *fields)
+    )
+    previews = defaultdict(list)
+    for row in sorted(rows, key=lambda row: row['preview_rank']):
+        previews[row[group]].append(row)
+    return previews
+
+
+def _new_workload():
+    return {'total': 0, 'completed': 0, 'in_progress': 0, 'blocked': 0}
+
+
+def _aggregate_action_counts(path):
+    """
+    Tally a path's action items in one GROUP BY (status, assignee_name) query.
+
+    Returns ``(total, by_status, assignee_workload)``: the item count, a count per ItemStatus
+    value, and the ``{'total', 'completed', 'in_progress', 'blocked'}`` counters per assignee.
+    """
+    rows = (
+        ActionItem.objects.filter(step__phase__path=path)
+        .order_by()
+        .values('status', 'assignee_name')
+        .annotate(n=models.Count('id'))
+    )
+    total = 0
+    by_status = dict.fromkeys(ItemStatus.values, 0)
+    workload = {}
+    for row in rows:
+        item_status, n = row['status'], row['n']
+        total += n
+        by_status[item_status] = by_status.get(item_status, 0) + n
+        if row['assignee_name']:
+            counters = workload.setdefault(row['assignee_name'], _new_workload())
+            counters['total'] += n
+            if item_status == ItemStatus.DONE:
+                counters['completed'] += n
+            elif item_status in (ItemStatus.IN_PROGRESS, ItemStatus.BLOCKED):
+                counters[item_status] += n
+    return total, by_status, workload
+
+
+def _keyword_route(handler, *keywords):
+    """Pair an ai_query response handler with a regex matching any of ``keywords`` as a substring."""
+    return re.compile('|'.join(map(re.escape, keywords))), handler
+
+
 class PathViewSet(viewsets.ModelViewSet):
     """
     API endpoint for the Path Library.
@@ -77,16 +273,53 @@ class PathViewSet(viewsets.ModelViewSet):
     A Path represents the complete improvement journey:
     Issue -> Root Cause -> Initiative -> Implementation Plan (Phases > Steps > Actions)
     """
-    queryset = Path.objects.select_related(
-        'issue', 'root_cause', 'initiative'
-    ).prefetch_related(
-        'phases__steps__action_items', 'comments'
-    )
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    queryset = Path.objects.select_related('issue', 'root_cause', 'initiative')
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = PathFilter
+    pagination_class = PathCursorPagination
     search_fields = ['title', 'goal_statement', 'notes']
     ordering_fields = ['created_at', 'updated_at', 'priority', 'progress_percentage', 'target_completion_date']
-    ordering = ['-updated_at']
+    ordering = ['-updated_at', '-id']
+    # Path columns PathListSerializer renders; the list projects only these
+    list_columns = [
+        'id', 'title', 'status', 'priority', 'progress_percentage',
+        'started_at', 'target_completion_date', 'completed_at', 'paused_at',
+        'team_size', 'duration_days', 'project_summary',
+        'created_at', 'updated_at',
+    ]
+    # Path columns update_status writes
+    status_columns = ['status', 'started_at', 'paused_at', 'completed_at', 'updated_at']
+
+    def get_queryset(self):
+        if self.action == 'list':
+            # A narrow values() projection: the related titles are joined in as single columns,
+            # the action item counts are the denormalized counters kept by paths.signals, and
+            # only the phase count still needs a (single) subquery.
+            return Path.objects.values(
+                *self.list_columns,
+                issue_title=models.F('issue__title'),
+                root_cause_title=models.F('root_cause__title'),
+                initiative_title=models.F('initiative__title'),
+                phase_count=_path_count(Phase, 'path'),
+                action_item_count=models.F('total_items'),
+                completed_action_count=models.F('done_items'),
+            )
+        if self.action == 'retrieve':
+            # Everything PathDetailSerializer nests, loaded once per relation
+            return super().get_queryset().prefetch_related(
+                _phase_tree_prefetch(),
+                models.Prefetch(
+                    'comments',
+                    queryset=PathComment.objects.order_by('-created_at')[:RECENT_COMMENT_LIMIT],
+                    to_attr='recent_comments',
+                ),
+                models.Prefetch('issue__root_causes', queryset=RootCause.objects.order_by(*ROOT_CAUSE_RANKING)),
+                'root_cause__initiatives',
+            )
+        if self.action == 'update_status':
+            # Only the columns update_status writes and returns; nothing nested is rendered
+            return Path.objects.only(*PathStatusResponseSerializer.Meta.fields)
+        return super().get_queryset()
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -119,8 +352,10 @@ class PathViewSet(viewsets.ModelViewSet):
         elif new_status == PathStatus.COMPLETED:
             path.completed_at = timezone.now()
 
-        path.save()
-        return Response(PathDetailSerializer(path).data)
+        # auto_now only refreshes updated_at when it is listed
+        path.save(update_fields=self.status_columns)
+        # Only the status fields; clients merge them into the detail they hold
+        return Response(PathStatusResponseSerializer(path).data)
 
     @action(detail=True, methods=['post'])
     def add_comment(self, request, pk=None):
@@ -128,31 +363,85 @@ class PathViewSet(viewsets.ModelViewSet):
         path = self.get_object()
         serializer = PathCommentSerializer(data={**request.data, 'path': path.id})
         serializer.is_valid(raise_exception=True)
-        comment = serializer.save()
-        return Response(PathCommentSerializer(comment).data, status=status.HTTP_201_CREATED)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], renderer_classes=[JSONRenderer])
     def library_stats(self, request):
         """Get statistics for the path library."""
-        queryset = self.filter_queryset(self.get_queryset())
+        # Keyed by the filter parameters, under the version paths.signals renews on path changes
+        version = cache.get(LIBRARY_STATS_VERSION_KEY) or bump_library_stats_version()
+        params = urlencode(sorted(request.query_params.lists()), doseq=True)
+        key = f'libstats:{version}:{hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()}'
+        stats = cache.get(key)
+        if stats is None:
+            stats = self._library_stats(self.filter_queryset(self.get_queryset()))
+            cache.set(key, stats, LIBRARY_STATS_CACHE_SECONDS)
+        return Response(stats)
 
-        stats = {
-            'total_paths': queryset.count(),
+    def _library_stats(self, queryset):
+        """Status counts and average active progress of the paths in ``queryset``."""
+        active = models.Q(status=PathStatus.ACTIVE)
+
+        # One conditional aggregate instead of a COUNT per status
+        agg = queryset.aggregate(
+            total=models.Count('id'),
+            active=models.Count('id', filter=active),
+            on_hold=models.Count('id', filter=models.Q(status=PathStatus.ON_HOLD)),
+            completed=models.Count('id', filter=models.Q(status=PathStatus.COMPLETED)),
+            archived=models.Count('id', filter=models.Q(status=PathStatus.ARCHIVED)),
+            average_progress=models.Avg('progress_percentage', filter=active),
+        )
+
+        return {
+            'total_paths': agg['total'],
             'by_status': {
-                'active': queryset.filter(status=PathStatus.ACTIVE).count(),
-                'on_hold': queryset.filter(status=PathStatus.ON_HOLD).count(),
-                'completed': queryset.filter(status=PathStatus.COMPLETED).count(),
-                'archived': queryset.filter(status=PathStatus.ARCHIVED).count(),
+                'active': agg['active'],
+                'on_hold': agg['on_hold'],
+                'completed': agg['completed'],
+                'archived': agg['archived'],
             },
-            'average_progress': queryset.filter(
-                status=PathStatus.ACTIVE
-            ).aggregate(
-                avg=models.Avg('progress_percentage')
-            )['avg'] or 0,
+            'average_progress': agg['average_progress'] or 0,
         }
-        return Response(stats)
 
-    @action(detail=True, methods=['post'])
+    # Checked in order; the first route whose keywords appear anywhere in the query answers it
+    AI_QUERY_ROUTES = [
+        # Status and progress queries
+        _keyword_route('_response_status_overview', 'status', 'progress', 'overview', 'how', 'doing', 'going'),
+        # Blockers and issues queries
+        _keyword_route('_response_blockers', 'block', 'issue', 'problem', 'stuck', 'risk', 'challenge'),
+        # Due dates and deadlines
+        _keyword_route('_response_deadlines', 'due', 'deadline', 'upcoming', 'soon', 'overdue', 'late'),
+        # Accomplishments and completed work
+        _keyword_route('_response_accomplishments', 'accomplish', 'done', 'complete', 'finish', 'solved', 'achieve', 'success'),
+        # Team and assignees
+        _keyword_route('_response_team', 'team', 'who', 'assignee', 'member', 'person', 'people', 'workload'),
+        # Phase information
+        _keyword_route('_response_phases', 'phase', 'stage', 'plan', 'implementation'),
+        # Step information
+        _keyword_route('_response_steps', 'step', 'task', 'action', 'activity'),
+        # Timeline and duration
+        _keyword_route('_response_timeline', 'timeline', 'duration', 'time', 'long', 'start', 'end', 'when'),
+        # Goal and purpose
+        _keyword_route('_response_goal', 'goal', 'purpose', 'why', 'objective', 'aim', 'target'),
+        # Issue, root cause, initiative chain
+        _keyword_route('_response_issue_chain', 'issue', 'root', 'cause', 'initiative', 'origin', 'source', 'feedback'),
+        # Success factors
+        _keyword_route('_response_success_factors', 'success', 'factor', 'key', 'critical', 'important'),
+        # Improvements and recommendations
+        _keyword_route('_response_improvements', 'improve', 'better', 'recommend', 'suggest', 'advice', 'help', 'optimize'),
+        # On hold / paused information
+        _keyword_route('_response_on_hold', 'hold', 'pause', 'stop', 'wait', 'delay'),
+        # Learning and insights
+        _keyword_route('_response_learnings', 'learn', 'insight', 'takeaway', 'lesson'),
+        # Summary / everything
+        _keyword_route('_response_full_summary', 'summary', 'everything', 'all', 'full', 'detail', 'tell me about'),
+    ]
+
+    # Handlers that print the plan tree (steps and per-phase progress) on top of the summary
+    AI_TREE_HANDLERS = {'_response_phases'}
+
+    @action(detail=True, methods=['post'], renderer_classes=[JSONRenderer])
     def ai_query(self, request, pk=None):
         """
         AI-powered query endpoint for path intelligence.
@@ -161,31 +450,84 @@ class PathViewSet(viewsets.ModelViewSet):
         path = self.get_object()
         query = request.data.get('query', '').lower()
 
-        # Build comprehensive path context
-        context = self._build_path_context(path)
+        # Answers depend on the route rather than the exact wording, so questions that
+        # match the same route share a cached answer. Some answers quote the linked issue,
+        # root cause and initiative, whose edits do not touch the path, so they key it too.
+        handler = self._match_ai_route(query)
+        origin = ':'.join(
+            obj.updated_at.isoformat() if obj else '-'
+            for obj in (path.issue, path.root_cause, path.initiative)
+        )
+        response = self._cached_path_context(
+            path, f'answer:{handler}:{origin}', lambda: self._answer_ai_query(path, handler)
+        )
+
+        return Response({'response': response})
+
+    def _answer_ai_query(self, path, handler):
+        """Run the ``handler`` response helper over the path's (cached) context."""
+        # The plan tree is only built for the answers that print it
+        context = self._cached_path_context(path, 'summary', lambda: self._build_path_summary(path))
+        if handler in self.AI_TREE_HANDLERS:
+            phases = self._cached_path_context(path, 'tree', lambda: self._build_path_tree(path, context['phases']))
+            context = {**context, 'phases': phases}
 
         # Generate contextual response based on query
-        response = self._generate_ai_response(query, path, context)
+        return getattr(self, handler)(path, context)
 
-        return Response({'response': response})
+    def _match_ai_route(self, query):
+        """Name of the response handler for ``query``: the first matching route, or the default."""
+        for pattern, handler in self.AI_QUERY_ROUTES:
+            if pattern.search(query):
+                return handler
+        # Default response with comprehensive info
+        return '_response_default'
 
-    def _build_path_context(self, path):
-        """Build a comprehensive context object with all path data."""
+    def _cached_path_context(self, path, part, build):
+        """
+        Return ``build()`` for the ``part`` of the path's context or answers, reusing it across follow-up questions.
+
+        The paths.signals handlers bump ``updated_at`` on every write to the path's phases,
+        steps and action items, so the key changes with the plan, and with the date that
+        overdue items are judged against.
+        """
+        key = f'pathctx:{part}:{path.pk}:{path.updated_at.isoformat()}:{date.today().isoformat()}'
+        context = cache.get(key)
+        if context is None:
+            context = build()
+            cache.set(key, context, AI_CONTEXT_CACHE_SECONDS)
+        return context
+
+    def _build_path_summary(self, path):
+        """Build the counts, pending item lists and phase list that every answer draws on."""
         today = date.today()
 
         context = {
+            # The day overdue and upcoming items were classified against
+            'today': today,
+
             # Basic stats
             'total_actions': 0,
             'completed_actions': 0,
+            'blocked_count': 0,
+            'in_progress_count': 0,
+            'todo_count': 0,
+            'overdue_count': 0,
+            'open_unassigned_count': 0,
+            'open_undated_count': 0,
+            'all_assignees': set(),
+            'assignee_count': 0,
+
+            # The first AI_PREVIEW_LIMIT pending items of each kind
             'blocked_actions': [],
             'in_progress_actions': [],
-            'todo_actions': [],
             'overdue_actions': [],
-            'upcoming_due': [],
-            'all_assignees': set(),
+            'upcoming_due_by_bucket': {'overdue': [], 'this_week': [], 'later': []},
+            'upcoming_due_counts': {'overdue': 0, 'this_week': 0, 'later': 0},
 
             # Phase details
             'phases': [],
+            'phase_count': 0,
             'completed_phases': 0,
             'in_progress_phases': 0,
 
@@ -206,335 +548,301 @@ class PathViewSet(viewsets.ModelViewSet):
         if path.started_at:
             context['days_active'] = (today - path.started_at.date()).days
 
-        # Process all phases, steps, and action items
-        for phase in path.phases.all().order_by('order'):
-            phase_data = {
-                'title': phase.title,
-                'description': phase.description,
-                'status': phase.status,
-                'progress': phase.calculate_progress(),
-                'assignee': phase.assignee_name,
-                'due_date': phase.due_date,
-                'priority': phase.priority,
-                'category': phase.category,
-                'workload_days': phase.workload_days,
-                'steps': [],
-                'total_actions': 0,
-                'completed_actions': 0,
-            }
-
-            if phase.status == ItemStatus.DONE:
+        # Counts come from SQL; only the previewed items are loaded
+        total, by_status, workload = _aggregate_action_counts(path)
+        context['total_actions'] = total
+        context['completed_actions'] = by_status[ItemStatus.DONE]
+        context['blocked_count'] = by_status[ItemStatus.BLOCKED]
+        context['in_progress_count'] = by_status[ItemStatus.IN_PROGRESS]
+        context['todo_count'] = by_status[ItemStatus.TODO]
+        context['by_status'] = by_status
+        context['assignee_workload'] = workload
+        context['all_assignees'].update(workload)
+
+        phases = Phase.objects.filter(path=path).order_by(*SIBLING_ORDER).values(
+            'id', 'title', 'description', 'status', 'assignee_name', 'due_date',
+            'priority', 'category', 'workload_days',
+        )
+        for phase in phases:
+            context['phases'].append({
+                'id': phase['id'],
+                'title': phase['title'],
+                'description': phase['description'],
+                'status': phase['status'],
+                'assignee': phase['assignee_name'],
+                'due_date': phase['due_date'],
+                'priority': phase['priority'],
+                'category': phase['category'],
+                'workload_days': phase['workload_days'],
+            })
+
+            if phase['status'] == ItemStatus.DONE:
                 context['completed_phases'] += 1
-            elif phase.status == ItemStatus.IN_PROGRESS:
+            elif phase['status'] == ItemStatus.IN_PROGRESS:
                 context['in_progress_phases'] += 1
 
-            if phase.assignee_name:
-                context['all_assignees'].add(phase.assignee_name)
-                if phase.assignee_name not in context['assignee_workload']:
-                    context['assignee_workload'][phase.assignee_name] = {'total': 0, 'completed': 0, 'in_progress': 0, 'blocked': 0}
-
-            for step in phase.steps.all().order_by('order'):
-                step_data = {
-                    'title': step.title,
-                    'description': step.description,
-                    'status': step.status,
-                    'progress': step.calculate_progress(),
-                    'assignee': step.assignee_name,
-                    'due_date': step.due_date,
-                    'priority': step.priority,
-                    'category': step.category,
-                    'action_items': [],
-                }
-
-                if step.assignee_name:
-                    context['all_assignees'].add(step.assignee_name)
-                    if step.assignee_name not in context['assignee_workload']:
-                        context['assignee_workload'][step.assignee_name] = {'total': 0, 'completed': 0, 'in_progress': 0, 'blocked': 0}
-
-                if step.category:
-                    context['by_category'][step.category] = context['by_category'].get(step.category, 0) + 1
-
-                for item in step.action_items.all().order_by('order'):
-                    context['total_actions'] += 1
-                    phase_data['total_actions'] += 1
-
-                    item_data = {
-                        'title': item.title,
-                        'description': item.description,
-                        'status': item.status,
-                        'assignee': item.assignee_name,
-                        'due_date': item.due_date,
-                        'completed_at': item.completed_at,
-                        'notes': item.notes,
-                        'phase': phase.title,
-                        'step': step.title,
-                    }
-
-                    if item.assignee_name:
-                        context['all_assignees'].add(item.assignee_name)
-                        if item.assignee_name not in context['assignee_workload']:
-                            context['assignee_workload'][item.assignee_name] = {'total': 0, 'completed': 0, 'in_progress': 0, 'blocked': 0}
-                        context['assignee_workload'][item.assignee_name]['total'] += 1
-
-                    if item.status == ItemStatus.DONE:
-                        context['completed_actions'] += 1
-                        phase_data['completed_actions'] += 1
-                        if item.assignee_name:
-                            context['assignee_workload'][item.assignee_name]['completed'] += 1
-                    elif item.status == ItemStatus.BLOCKED:
-                        context['blocked_actions'].append(item_data)
-                        if item.assignee_name:
-                            context['assignee_workload'][item.assignee_name]['blocked'] += 1
-                    elif item.status == ItemStatus.IN_PROGRESS:
-                        context['in_progress_actions'].append(item_data)
-                        if item.assignee_name:
-                            context['assignee_workload'][item.assignee_name]['in_progress'] += 1
-                    else:
-                        context['todo_actions'].append(item_data)
-
-                    # Track due dates
-                    if item.due_date and item.status != ItemStatus.DONE:
-                        if item.due_date < today:
-                            context['overdue_actions'].append(item_data)
-                        context['upcoming_due'].append(item_data)
-
-                        if context['earliest_due'] is None or item.due_date < context['earliest_due']:
-                            context['earliest_due'] = item.due_date
-                        if context['latest_due'] is None or item.due_date > context['latest_due']:
-                            context['latest_due'] = item.due_date
-
-                    step_data['action_items'].append(item_data)
-
-                phase_data['steps'].append(step_data)
-
-            context['phases'].append(phase_data)
-
-        # Sort lists
-        context['upcoming_due'].sort(key=lambda x: x['due_date'] if x['due_date'] else today + timedelta(days=9999))
-        context['overdue_actions'].sort(key=lambda x: x['due_date'] if x['due_date'] else today)
-
+            if phase['assignee_name']:
+                context['all_assignees'].add(phase['assignee_name'])
+                context['assignee_workload'].setdefault(phase['assignee_name'], _new_workload())
+
+        # Distinct (lead, category) pairs of the steps, rather than one row per step
+        step_groups = (
+            Step.objects.filter(phase__path=path)
+            .order_by()
+            .values('assignee_name', 'category')
+            .annotate(n=models.Count('id'))
+        )
+        for group in step_groups:
+            if group['assignee_name']:
+                context['all_assignees'].add(group['assignee_name'])
+                context['assignee_workload'].setdefault(group['assignee_name'], _new_workload())
+
+            if group['category']:
+                context['by_category'][group['category']] = context['by_category'].get(group['category'], 0) + group['n']
+
+        pending = _pending_item_counts(path, today)
+        for bucket in context['upcoming_due_counts']:
+            context['upcoming_due_counts'][bucket] = pending[bucket]
+        context['overdue_count'] = pending['overdue']
+        context['open_unassigned_count'] = pending['open_unassigned']
+        context['open_undated_count'] = pending['open_undated']
+        context['earliest_due'] = pending['earliest_due']
+        context['latest_due'] = pending['latest_due']
+
+        # Top of each list: blocked and in progress items in plan order, dated items by due date
+        status_previews = _ranked_previews(
+            _pending_items(path).filter(status__in=[ItemStatus.BLOCKED, ItemStatus.IN_PROGRESS]),
+            'status', PLAN_ORDER,
+        )
+        due_previews = _ranked_previews(
+            _pending_items(path).filter(due_date__isnull=False).annotate(due_bucket=_due_bucket(today)),
+            'due_bucket', ('due_date', *PLAN_ORDER),
+        )
+        context['blocked_actions'] = [self._preview_item(row, today) for row in status_previews[ItemStatus.BLOCKED]]
+        context['in_progress_actions'] = [self._preview_item(row, today) for row in status_previews[ItemStatus.IN_PROGRESS]]
+        for bucket in context['upcoming_due_by_bucket']:
+            context['upcoming_due_by_bucket'][bucket] = [self._preview_item(row, today) for row in due_previews[bucket]]
+        context['overdue_actions'] = context['upcoming_due_by_bucket']['overdue']
+
+        context['phase_count'] = len(context['phases'])
+        context['assignee_count'] = len(context['all_assignees'])
         return context
 
-    def _generate_ai_response(self, query, path, ctx):
-        """Generate an intelligent response based on the query and comprehensive path context."""
-        today = date.today()
-
-        # Status and progress queries
-        if any(word in query for word in ['status', 'progress', 'overview', 'how', 'doing', 'going']):
-            return self._response_status_overview(path, ctx)
-
-        # Blockers and issues queries
-        if any(word in query for word in ['block', 'issue', 'problem', 'stuck', 'risk', 'challenge']):
-            return self._response_blockers(path, ctx)
-
-        # Due dates and deadlines
-        if any(word in query for word in ['due', 'deadline', 'upcoming', 'soon', 'overdue', 'late']):
-            return self._response_deadlines(path, ctx, today)
-
-        # Accomplishments and completed work
-        if any(word in query for word in ['accomplish', 'done', 'complete', 'finish', 'solved', 'achieve', 'success']):
-            return self._response_accomplishments(path, ctx)
-
-        # Team and assignees
-        if any(word in query for word in ['team', 'who', 'assignee', 'member', 'person', 'people', 'workload']):
-            return self._response_team(path, ctx)
-
-        # Phase information
-        if any(word in query for word in ['phase', 'stage', 'plan', 'implementation']):
-            return self._response_phases(path, ctx)
-
-        # Step information
-        if any(word in query for word in ['step', 'task', 'action', 'activity']):
-            return self._response_steps(path, ctx)
-
-        # Timeline and duration
-        if any(word in query for word in ['timeline', 'duration', 'time', 'long', 'start', 'end', 'when']):
-            return self._response_timeline(path, ctx, today)
-
-        # Goal and purpose
-        if any(word in query for word in ['goal', 'purpose', 'why', 'objective', 'aim', 'target']):
-            return self._response_goal(path, ctx)
-
-        # Issue, root cause, initiative chain
-        if any(word in query for word in ['issue', 'root', 'cause', 'initiative', 'origin', 'source', 'feedback']):
-            return self._response_issue_chain(path, ctx)
-
-        # Success factors
-        if any(word in query for word in ['success', 'factor', 'key', 'critical', 'important']):
-            return self._response_success_factors(path, ctx)
-
-        # Improvements and recommendations
-        if any(word in query for word in ['improve', 'better', 'recommend', 'suggest', 'advice', 'help', 'optimize']):
-            return self._response_improvements(path, ctx)
-
-        # On hold / paused information
-        if any(word in query for word in ['hold', 'pause', 'stop', 'wait', 'delay']):
-            return self._response_on_hold(path, ctx)
+    def _preview_item(self, row, today):
+        """Item dict that the response helpers print, from a ``_ranked_previews`` row."""
+        due_date = row['due_date']
+        return {
+            'title': row['title'],
+            'status': row['status'],
+            'assignee': row['assignee_name'],
+            'due_date': due_date,
+            # Negative when overdue
+            'days_vs_today': (due_date - today).days if due_date else None,
+            'phase': row['phase_title'],
+            'step': row['step_title'],
+        }
 
-        # Learning and insights
-        if any(word in query for word in ['learn', 'insight', 'takeaway', 'lesson']):
-            return self._response_learnings(path, ctx)
+    def _build_path_tree(self, path, phases):
+        """Return the summary's ``phases`` extended with their steps and action item progress."""
+        # (total, done) action items per step, counted in SQL
+        step_counts = {
+            row['step_id']: (row['total'], row['done'])
+            for row in ActionItem.objects.filter(step__phase__path=path)
+            .order_by()
+            .values('step_id')
+            .annotate(
+                total=models.Count('id'),
+                done=models.Count('id', filter=models.Q(status=ItemStatus.DONE)),
+            )
+        }
 
-        # Summary / everything
-        if any(word in query for word in ['summary', 'everything', 'all', 'full', 'detail', 'tell me about']):
-            return self._response_full_summary(path, ctx)
+        steps_by_phase = defaultdict(list)
+        steps = Step.objects.filter(phase__path=path).order_by(*SIBLING_ORDER).values(
+            'id', 'phase_id', 'title', 'status', 'assignee_name', 'due_date', 'priority', 'category',
+        )
+        for step in steps:
+            total, completed = step_counts.get(step['id'], (0, 0))
+            steps_by_phase[step['phase_id']].append({
+                'title': step['title'],
+                'status': step['status'],
+                # Matches calculate_progress()
+                'progress': completed * 100 // total if total else 0,
+                'assignee': step['assignee_name'],
+                'due_date': step['due_date'],
+                'priority': step['priority'],
+                'category': step['category'],
+                'total_actions': total,
+                'completed_actions': completed,
+            })
 
-        # Default response with comprehensive info
-        return self._response_default(path, ctx)
+        tree = []
+        for phase in phases:
+            phase_steps = steps_by_phase[phase['id']]
+            total = sum(step['total_actions'] for step in phase_steps)
+            completed = sum(step['completed_actions'] for step in phase_steps)
+            tree.append({
+                **phase,
+                'steps': phase_steps,
+                'progress': completed * 100 // total if total else 0,
+                'total_actions': total,
+                'completed_actions': completed,
+            })
+        return tree
 
     def _response_status_overview(self, path, ctx):
         """Generate status overview response."""
         status_map = {'active': 'Active', 'on_hold': 'On Hold', 'completed': 'Completed', 'archived': 'Archived'}
         status_text = status_map.get(path.status, path.status)
 
-        response = f"📊 **Path Status Overview**\n\n"
-        response += f"**{path.title}**\n"
-        response += f"Status: **{status_text}** | Progress: **{path.progress_percentage}%**\n\n"
+        parts = [f"📊 **Path Status Overview**\n\n"]
+        parts.append(f"**{path.title}**\n")
+        parts.append(f"Status: **{status_text}** | Progress: **{path.progress_percentage}%**\n\n")
 
-        response += f"**Action Items:**\n"
-        response += f"• ✅ Completed: {ctx['completed_actions']}/{ctx['total_actions']}\n"
-        response += f"• 🔄 In Progress: {len(ctx['in_progress_actions'])}\n"
-        response += f"• ⏳ To Do: {len(ctx['todo_actions'])}\n"
+        parts.append(f"**Action Items:**\n")
+        parts.append(f"• ✅ Completed: {ctx['completed_actions']}/{ctx['total_actions']}\n")
+        parts.append(f"• 🔄 In Progress: {ctx['in_progress_count']}\n")
+        parts.append(f"• ⏳ To Do: {ctx['todo_count']}\n")
 
-        if ctx['blocked_actions']:
-            response += f"• ⚠️ Blocked: {len(ctx['blocked_actions'])}\n"
-        if ctx['overdue_actions']:
-            response += f"• 🔴 Overdue: {len(ctx['overdue_actions'])}\n"
+        if ctx['blocked_count']:
+            parts.append(f"• ⚠️ Blocked: {ctx['blocked_count']}\n")
+        if ctx['overdue_count']:
+            parts.append(f"• 🔴 Overdue: {ctx['overdue_count']}\n")
 
-        response += f"\n**Phases:** {ctx['completed_phases']}/{len(ctx['phases'])} completed"
+        parts.append(f"\n**Phases:** {ctx['completed_phases']}/{ctx['phase_count']} completed")
 
         if ctx['in_progress_phases'] > 0:
-            response += f", {ctx['in_progress_phases']} in progress"
+            parts.append(f", {ctx['in_progress_phases']} in progress")
 
         if path.target_completion_date:
             days_left = (path.target_completion_date - date.today()).days
             if days_left > 0:
-                response += f"\n\n📅 **{days_left} days** until target completion ({path.target_completion_date.strftime('%B %d, %Y')})"
+                parts.append(f"\n\n📅 **{days_left} days** until target completion ({path.target_completion_date.strftime('%B %d, %Y')})")
             elif days_left == 0:
-                response += f"\n\n📅 Target completion is **TODAY**!"
+                parts.append(f"\n\n📅 Target completion is **TODAY**!")
             else:
-                response += f"\n\n🔴 Target completion was **{abs(days_left)} days ago**"
+                parts.append(f"\n\n🔴 Target completion was **{abs(days_left)} days ago**")
 
         if ctx['all_assignees']:
-            response += f"\n👥 **{len(ctx['all_assignees'])}** team members involved"
+            parts.append(f"\n👥 **{ctx['assignee_count']}** team members involved")
 
-        return response
+        return ''.join(parts)
 
     def _response_blockers(self, path, ctx):
         """Generate blockers and risks response."""
-        response = "⚠️ **Blockers & Risks**\n\n"
+        parts = ["⚠️ **Blockers & Risks**\n\n"]
 
-        if not ctx['blocked_actions'] and not ctx['overdue_actions']:
-            response += "✅ **No current blockers or overdue items!**\n\n"
-            response += "All tasks are on track."
+        if not ctx['blocked_count'] and not ctx['overdue_count']:
+            parts.append("✅ **No current blockers or overdue items!**\n\n")
+            parts.append("All tasks are on track.")
 
             # Add potential risks
-            if len(ctx['in_progress_actions']) > 5:
-                response += f"\n\n⚡ **Potential risk:** {len(ctx['in_progress_actions'])} items are in progress simultaneously. Consider focusing on fewer items."
+            if ctx['in_progress_count'] > 5:
+                parts.append(f"\n\n⚡ **Potential risk:** {ctx['in_progress_count']} items are in progress simultaneously. Consider focusing on fewer items.")
 
-            return response
+            return ''.join(parts)
 
-        if ctx['blocked_actions']:
-            response += f"**🚫 Blocked Tasks ({len(ctx['blocked_actions'])})**\n\n"
+        if ctx['blocked_count']:
+            parts.append(f"**🚫 Blocked Tasks ({ctx['blocked_count']})**\n\n")
             for i, item in enumerate(ctx['blocked_actions'][:5], 1):
-                response += f"{i}. **{item['title']}**\n"
-                response += f"   📍 {item['phase']} → {item['step']}\n"
+                parts.append(f"{i}. **{item['title']}**\n")
+                parts.append(f"   📍 {item['phase']} → {item['step']}\n")
                 if item['assignee']:
-                    response += f"   👤 {item['assignee']}\n"
-            if len(ctx['blocked_actions']) > 5:
-                response += f"\n... and {len(ctx['blocked_actions']) - 5} more\n"
+                    parts.append(f"   👤 {item['assignee']}\n")
+            if ctx['blocked_count'] > 5:
+                parts.append(f"\n... and {ctx['blocked_count'] - 5} more\n")
 
-        if ctx['overdue_actions']:
-            response += f"\n**🔴 Overdue Tasks ({len(ctx['overdue_actions'])})**\n\n"
+        if ctx['overdue_count']:
+            parts.append(f"\n**🔴 Overdue Tasks ({ctx['overdue_count']})**\n\n")
             for i, item in enumerate(ctx['overdue_actions'][:5], 1):
-                days_overdue = (date.today() - item['due_date']).days
-                response += f"{i}. **{item['title']}** - {days_overdue} days overdue\n"
+                days_overdue = -item['days_vs_today']
+                parts.append(f"{i}. **{item['title']}** - {days_overdue} days overdue\n")
                 if item['assignee']:
-                    response += f"   👤 {item['assignee']}\n"
+                    parts.append(f"   👤 {item['assignee']}\n")
 
-        return response
+        return ''.join(parts)
 
-    def _response_deadlines(self, path, ctx, today):
+    def _response_deadlines(self, path, ctx):
         """Generate deadlines response."""
-        if not ctx['upcoming_due']:
+        counts = ctx['upcoming_due_counts']
+        if not sum(counts.values()):
             return "📅 **No pending tasks with due dates.**\n\nAll tasks either have no due date set or are already completed."
 
-        response = "📅 **Upcoming Deadlines**\n\n"
+        parts = ["📅 **Upcoming Deadlines**\n\n"]
 
-        # Group by urgency
-        overdue = [x for x in ctx['upcoming_due'] if x['due_date'] and x['due_date'] < today]
-        this_week = [x for x in ctx['upcoming_due'] if x['due_date'] and today <= x['due_date'] <= today + timedelta(days=7)]
-        later = [x for x in ctx['upcoming_due'] if x['due_date'] and x['due_date'] > today + timedelta(days=7)]
+        # Previews of each urgency bucket, with the bucket sizes in ``counts``
+        overdue = ctx['upcoming_due_by_bucket']['overdue']
+        this_week = ctx['upcoming_due_by_bucket']['this_week']
+        later = ctx['upcoming_due_by_bucket']['later']
 
         if overdue:
-            response += f"**🔴 OVERDUE ({len(overdue)})**\n"
+            parts.append(f"**🔴 OVERDUE ({counts['overdue']})**\n")
             for item in overdue[:3]:
-                days = (today - item['due_date']).days
-                response += f"• {item['title']} ({days}d late)"
+                days = -item['days_vs_today']
+                parts.append(f"• {item['title']} ({days}d late)")
                 if item['assignee']:
-                    response += f" - {item['assignee']}"
-                response += "\n"
-            response += "\n"
+                    parts.append(f" - {item['assignee']}")
+                parts.append("\n")
+            parts.append("\n")
 
         if this_week:
-            response += f"**🟠 This Week ({len(this_week)})**\n"
+            parts.append(f"**🟠 This Week ({counts['this_week']})**\n")
             for item in this_week[:5]:
-                days = (item['due_date'] - today).days
+                days = item['days_vs_today']
                 day_text = "TODAY" if days == 0 else f"in {days}d"
-                response += f"• {item['title']} ({day_text})"
+                parts.append(f"• {item['title']} ({day_text})")
                 if item['assignee']:
-                    response += f" - {item['assignee']}"
-                response += "\n"
-            response += "\n"
+                    parts.append(f" - {item['assignee']}")
+                parts.append("\n")
+            parts.append("\n")
 
         if later:
-            response += f"**🟢 Later ({len(later)})**\n"
+            parts.append(f"**🟢 Later ({counts['later']})**\n")
             for item in later[:3]:
-                response += f"• {item['title']} ({item['due_date'].strftime('%b %d')})\n"
+                parts.append(f"• {item['title']} ({item['due_date'].strftime('%b %d')})\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_accomplishments(self, path, ctx):
         """Generate accomplishments response."""
-        response = "✅ **Accomplishments & Progress**\n\n"
+        parts = ["✅ **Accomplishments & Progress**\n\n"]
 
         if ctx['completed_actions'] == 0:
-            response += "No tasks have been completed yet.\n"
-            if ctx['in_progress_actions']:
-                response += f"\n🔄 **{len(ctx['in_progress_actions'])} tasks** are currently in progress."
-            return response
+            parts.append("No tasks have been completed yet.\n")
+            if ctx['in_progress_count']:
+                parts.append(f"\n🔄 **{ctx['in_progress_count']} tasks** are currently in progress.")
+            return ''.join(parts)
 
-        response += f"**{ctx['completed_actions']}** of **{ctx['total_actions']}** action items completed (**{path.progress_percentage}%**)\n\n"
+        parts.append(f"**{ctx['completed_actions']}** of **{ctx['total_actions']}** action items completed (**{path.progress_percentage}%**)\n\n")
 
         # Show completed phases
         completed_phases = [p for p in ctx['phases'] if p['status'] == 'done']
         if completed_phases:
-            response += "**Completed Phases:**\n"
+            parts.append("**Completed Phases:**\n")
             for phase in completed_phases:
-                response += f"✅ {phase['title']}\n"
-            response += "\n"
+                parts.append(f"✅ {phase['title']}\n")
+            parts.append("\n")
 
         # Show what was solved (if available)
         if path.what_was_solved:
-            response += "**What Was Solved:**\n"
+            parts.append("**What Was Solved:**\n")
             for item in path.what_was_solved:
-                response += f"• {item}\n"
-            response += "\n"
+                parts.append(f"• {item}\n")
+            parts.append("\n")
 
         # Show key learnings (if available)
         if path.key_learnings:
-            response += "**Key Learnings:**\n"
+            parts.append("**Key Learnings:**\n")
             for item in path.key_learnings:
-                response += f"• {item}\n"
+                parts.append(f"• {item}\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_team(self, path, ctx):
         """Generate team information response."""
         if not ctx['all_assignees']:
             return "👥 **Team**\n\nNo team members have been assigned to this path yet."
 
-        response = f"👥 **Team ({len(ctx['all_assignees'])} members)**\n\n"
+        parts = [f"👥 **Team ({ctx['assignee_count']} members)**\n\n"]
 
         for name in sorted(ctx['all_assignees']):
             workload = ctx['assignee_workload'].get(name, {})
@@ -543,174 +851,175 @@ class PathViewSet(viewsets.ModelViewSet):
             in_progress = workload.get('in_progress', 0)
             blocked = workload.get('blocked', 0)
 
-            response += f"**{name}**\n"
+            parts.append(f"**{name}**\n")
             if total > 0:
-                response += f"   • Tasks: {completed}/{total} done"
+                parts.append(f"   • Tasks: {completed}/{total} done")
                 if in_progress:
-                    response += f", {in_progress} in progress"
+                    parts.append(f", {in_progress} in progress")
                 if blocked:
-                    response += f", ⚠️ {blocked} blocked"
-                response += "\n"
-            response += "\n"
+                    parts.append(f", ⚠️ {blocked} blocked")
+                parts.append("\n")
+            parts.append("\n")
 
         if path.team_size:
-            response += f"📊 Official team size: {path.team_size} member(s)"
+            parts.append(f"📊 Official team size: {path.team_size} member(s)")
 
-        return response
+        return ''.join(parts)
 
     def _response_phases(self, path, ctx):
         """Generate phases information response."""
         if not ctx['phases']:
             return "📋 **Implementation Plan**\n\nNo phases have been defined yet."
 
-        response = "📋 **Implementation Phases**\n\n"
+        parts = ["📋 **Implementation Phases**\n\n"]
 
         for i, phase in enumerate(ctx['phases'], 1):
             status_emoji = "✅" if phase['status'] == 'done' else "🔄" if phase['status'] == 'in_progress' else "⏳"
-            response += f"{status_emoji} **Phase {i}: {phase['title']}** ({phase['progress']}%)\n"
+            parts.append(f"{status_emoji} **Phase {i}: {phase['title']}** ({phase['progress']}%)\n")
 
             if phase['description']:
-                response += f"   {phase['description'][:100]}{'...' if len(phase['description']) > 100 else ''}\n"
+                parts.append(f"   {_ellipsize(phase['description'], 100)}\n")
 
-            response += f"   • {len(phase['steps'])} steps, {phase['completed_actions']}/{phase['total_actions']} tasks done\n"
+            parts.append(f"   • {len(phase['steps'])} steps, {phase['completed_actions']}/{phase['total_actions']} tasks done\n")
 
             if phase['assignee']:
-                response += f"   • Lead: {phase['assignee']}\n"
+                parts.append(f"   • Lead: {phase['assignee']}\n")
             if phase['due_date']:
-                response += f"   • Due: {phase['due_date'].strftime('%b %d, %Y')}\n"
+                parts.append(f"   • Due: {phase['due_date'].strftime('%b %d, %Y')}\n")
             if phase['priority'] and phase['priority'] != 'medium':
-                response += f"   • Priority: {phase['priority'].upper()}\n"
+                parts.append(f"   • Priority: {phase['priority'].upper()}\n")
 
-            response += "\n"
+            parts.append("\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_steps(self, path, ctx):
         """Generate steps/tasks information response."""
-        response = "📝 **Steps & Tasks**\n\n"
+        parts = ["📝 **Steps & Tasks**\n\n"]
 
-        response += f"**Summary:**\n"
-        response += f"• Total action items: {ctx['total_actions']}\n"
-        response += f"• Completed: {ctx['completed_actions']}\n"
-        response += f"• In Progress: {len(ctx['in_progress_actions'])}\n"
-        response += f"• To Do: {len(ctx['todo_actions'])}\n"
-        response += f"• Blocked: {len(ctx['blocked_actions'])}\n\n"
+        parts.append(f"**Summary:**\n")
+        parts.append(f"• Total action items: {ctx['total_actions']}\n")
+        parts.append(f"• Completed: {ctx['completed_actions']}\n")
+        parts.append(f"• In Progress: {ctx['in_progress_count']}\n")
+        parts.append(f"• To Do: {ctx['todo_count']}\n")
+        parts.append(f"• Blocked: {ctx['blocked_count']}\n\n")
 
         # Show in-progress items
-        if ctx['in_progress_actions']:
-            response += "**🔄 Currently In Progress:**\n"
+        if ctx['in_progress_count']:
+            parts.append("**🔄 Currently In Progress:**\n")
             for item in ctx['in_progress_actions'][:5]:
-                response += f"• {item['title']}"
+                parts.append(f"• {item['title']}")
                 if item['assignee']:
-                    response += f" ({item['assignee']})"
-                response += "\n"
-            if len(ctx['in_progress_actions']) > 5:
-                response += f"... and {len(ctx['in_progress_actions']) - 5} more\n"
+                    parts.append(f" ({item['assignee']})")
+                parts.append("\n")
+            if ctx['in_progress_count'] > 5:
+                parts.append(f"... and {ctx['in_progress_count'] - 5} more\n")
 
-        return response
+        return ''.join(parts)
 
-    def _response_timeline(self, path, ctx, today):
+    def _response_timeline(self, path, ctx):
         """Generate timeline information response."""
-        response = "📅 **Timeline**\n\n"
+        today = ctx['today']
+        parts = ["📅 **Timeline**\n\n"]
 
         if path.started_at:
-            response += f"**Started:** {path.started_at.strftime('%B %d, %Y')} ({ctx['days_active']} days ago)\n"
+            parts.append(f"**Started:** {path.started_at.strftime('%B %d, %Y')} ({ctx['days_active']} days ago)\n")
 
         if path.target_completion_date:
             days_to_target = (path.target_completion_date - today).days
-            response += f"**Target Completion:** {path.target_completion_date.strftime('%B %d, %Y')}"
+            parts.append(f"**Target Completion:** {path.target_completion_date.strftime('%B %d, %Y')}")
             if days_to_target > 0:
-                response += f" ({days_to_target} days remaining)\n"
+                parts.append(f" ({days_to_target} days remaining)\n")
             elif days_to_target == 0:
-                response += " (TODAY)\n"
+                parts.append(" (TODAY)\n")
             else:
-                response += f" ({abs(days_to_target)} days overdue)\n"
+                parts.append(f" ({abs(days_to_target)} days overdue)\n")
 
         if path.completed_at:
-            response += f"**Completed:** {path.completed_at.strftime('%B %d, %Y')}\n"
+            parts.append(f"**Completed:** {path.completed_at.strftime('%B %d, %Y')}\n")
 
         if path.paused_at:
-            response += f"**Paused:** {path.paused_at.strftime('%B %d, %Y')}\n"
+            parts.append(f"**Paused:** {path.paused_at.strftime('%B %d, %Y')}\n")
 
         if path.duration_days:
-            response += f"**Estimated Duration:** {path.duration_days} days\n"
+            parts.append(f"**Estimated Duration:** {path.duration_days} days\n")
 
         if ctx['earliest_due'] and ctx['latest_due']:
-            response += f"\n**Task Timeline:**\n"
-            response += f"• Earliest due: {ctx['earliest_due'].strftime('%b %d, %Y')}\n"
-            response += f"• Latest due: {ctx['latest_due'].strftime('%b %d, %Y')}\n"
+            parts.append(f"\n**Task Timeline:**\n")
+            parts.append(f"• Earliest due: {ctx['earliest_due'].strftime('%b %d, %Y')}\n")
+            parts.append(f"• Latest due: {ctx['latest_due'].strftime('%b %d, %Y')}\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_goal(self, path, ctx):
         """Generate goal/purpose response."""
-        response = "🎯 **Goal & Purpose**\n\n"
+        parts = ["🎯 **Goal & Purpose**\n\n"]
 
-        response += f"**{path.title}**\n\n"
+        parts.append(f"**{path.title}**\n\n")
 
         if path.goal_statement:
-            response += f"**Goal:**\n{path.goal_statement}\n\n"
+            parts.append(f"**Goal:**\n{path.goal_statement}\n\n")
 
         if path.project_summary:
-            response += f"**Summary:**\n{path.project_summary}\n\n"
+            parts.append(f"**Summary:**\n{path.project_summary}\n\n")
 
         if path.issue:
-            response += f"**Addressing Issue:**\n{path.issue.title}\n"
+            parts.append(f"**Addressing Issue:**\n{path.issue.title}\n")
             if path.issue.description:
-                response += f"{path.issue.description[:200]}{'...' if len(path.issue.description) > 200 else ''}\n"
+                parts.append(f"{_ellipsize(path.issue.description, 200)}\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_issue_chain(self, path, ctx):
         """Generate issue > root cause > initiative chain response."""
-        response = "🔗 **Path Origin**\n\n"
+        parts = ["🔗 **Path Origin**\n\n"]
 
         if path.issue:
-            response += f"**📢 Issue:** {path.issue.title}\n"
+            parts.append(f"**📢 Issue:** {path.issue.title}\n")
             if path.issue.description:
-                response += f"   {path.issue.description[:150]}{'...' if len(path.issue.description) > 150 else ''}\n"
+                parts.append(f"   {_ellipsize(path.issue.description, 150)}\n")
             if path.issue.source_channel:
-                response += f"   Source: {path.issue.source_channel}\n"
+                parts.append(f"   Source: {path.issue.source_channel}\n")
             if path.issue.feedback_count > 1:
-                response += f"   Mentioned in {path.issue.feedback_count} feedback items\n"
-            response += "\n"
+                parts.append(f"   Mentioned in {path.issue.feedback_count} feedback items\n")
+            parts.append("\n")
 
         if path.root_cause:
-            response += f"**🔍 Root Cause:** {path.root_cause.title}\n"
+            parts.append(f"**🔍 Root Cause:** {path.root_cause.title}\n")
             if path.root_cause.description:
-                response += f"   {path.root_cause.description[:150]}{'...' if len(path.root_cause.description) > 150 else ''}\n"
+                parts.append(f"   {_ellipsize(path.root_cause.description, 150)}\n")
             if path.root_cause.cause_category:
-                response += f"   Category: {path.root_cause.cause_category}\n"
-            response += "\n"
+                parts.append(f"   Category: {path.root_cause.cause_category}\n")
+            parts.append("\n")
 
         if path.initiative:
-            response += f"**💡 Initiative:** {path.initiative.title}\n"
+            parts.append(f"**💡 Initiative:** {path.initiative.title}\n")
             if path.initiative.description:
-                response += f"   {path.initiative.description[:150]}{'...' if len(path.initiative.description) > 150 else ''}\n"
+                parts.append(f"   {_ellipsize(path.initiative.description, 150)}\n")
             if path.initiative.estimated_effort:
-                response += f"   Effort: {path.initiative.estimated_effort}\n"
+                parts.append(f"   Effort: {path.initiative.estimated_effort}\n")
             if path.initiative.estimated_impact:
-                response += f"   Impact: {path.initiative.estimated_impact}\n"
+                parts.append(f"   Impact: {path.initiative.estimated_impact}\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_success_factors(self, path, ctx):
         """Generate success factors response."""
-        response = "🏆 **Success Factors**\n\n"
+        parts = ["🏆 **Success Factors**\n\n"]
 
         # Based on path data, identify key success factors
         factors = []
 
-        if ctx['blocked_actions']:
-            factors.append(f"⚠️ **Resolve {len(ctx['blocked_actions'])} blocked items** to unblock progress")
+        if ctx['blocked_count']:
+            factors.append(f"⚠️ **Resolve {ctx['blocked_count']} blocked items** to unblock progress")
         else:
             factors.append("✅ No blocked items - good momentum!")
 
-        if ctx['overdue_actions']:
-            factors.append(f"🔴 **Address {len(ctx['overdue_actions'])} overdue tasks** urgently")
+        if ctx['overdue_count']:
+            factors.append(f"🔴 **Address {ctx['overdue_count']} overdue tasks** urgently")
 
-        if len(ctx['all_assignees']) > 0:
-            factors.append(f"👥 **{len(ctx['all_assignees'])} team members** are engaged")
+        if ctx['assignee_count'] > 0:
+            factors.append(f"👥 **{ctx['assignee_count']} team members** are engaged")
 
         if ctx['completed_phases'] > 0:
             factors.append(f"✅ **{ctx['completed_phases']} phases completed** - solid progress")
@@ -723,209 +1032,269 @@ class PathViewSet(viewsets.ModelViewSet):
         if path.goal_statement:
             factors.append("🎯 **Clear goal defined** - team knows the target")
 
-        for factor in factors:
-            response += f"• {factor}\n"
+        parts.extend(f"• {factor}\n" for factor in factors)
 
-        response += "\n**Recommendations:**\n"
-        if ctx['blocked_actions']:
-            response += "• Focus on unblocking stuck tasks first\n"
-        if len(ctx['in_progress_actions']) > 5:
-            response += "• Consider focusing on fewer tasks at once\n"
+        parts.append("\n**Recommendations:**\n")
+        if ctx['blocked_count']:
+            parts.append("• Focus on unblocking stuck tasks first\n")
+        if ctx['in_progress_count'] > 5:
+            parts.append("• Consider focusing on fewer tasks at once\n")
         if not ctx['all_assignees']:
-            response += "• Assign team members to tasks\n"
+            parts.append("• Assign team members to tasks\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_improvements(self, path, ctx):
         """Generate improvements/recommendations response."""
-        response = "💡 **Recommendations**\n\n"
+        parts = ["💡 **Recommendations**\n\n"]
 
         recommendations = []
 
         # Blocked items
-        if ctx['blocked_actions']:
-            recommendations.append({
-                'priority': 'high',
-                'text': f"Resolve {len(ctx['blocked_actions'])} blocked tasks to restore momentum"
-            })
+        if ctx['blocked_count']:
+            recommendations.append((
+                PRIORITY_HIGH,
+                f"Resolve {ctx['blocked_count']} blocked tasks to restore momentum",
+            ))
 
         # Overdue items
-        if ctx['overdue_actions']:
-            recommendations.append({
-                'priority': 'high',
-                'text': f"Address {len(ctx['overdue_actions'])} overdue items or adjust deadlines"
-            })
+        if ctx['overdue_count']:
+            recommendations.append((
+                PRIORITY_HIGH,
+                f"Address {ctx['overdue_count']} overdue items or adjust deadlines",
+            ))
 
         # Too many in progress
-        if len(ctx['in_progress_actions']) > 5:
-            recommendations.append({
-                'priority': 'medium',
-                'text': f"Focus on completing in-progress tasks ({len(ctx['in_progress_actions'])} active) before starting new ones"
-            })
+        if ctx['in_progress_count'] > 5:
+            recommendations.append((
+                PRIORITY_MEDIUM,
+                f"Focus on completing in-progress tasks ({ctx['in_progress_count']} active) before starting new ones",
+            ))
 
         # Unbalanced workload
         if ctx['assignee_workload']:
-            workloads = [(name, data['total']) for name, data in ctx['assignee_workload'].items()]
-            if workloads:
-                max_load = max(w[1] for w in workloads)
-                min_load = min(w[1] for w in workloads)
-                if max_load > 0 and min_load > 0 and max_load > min_load * 3:
-                    recommendations.append({
-                        'priority': 'medium',
-                        'text': "Consider redistributing tasks - workload appears uneven"
-                    })
+            # One pass for the lightest and heaviest load
+            min_load = max_load = None
+            for data in ctx['assignee_workload'].values():
+                load = data['total']
+                if min_load is None or load < min_load:
+                    min_load = load
+                if max_load is None or load > max_load:
+                    max_load = load
+            if max_load > 0 and min_load > 0 and max_load > min_load * 3:
+                recommendations.append((
+                    PRIORITY_MEDIUM,
+                    "Consider redistributing tasks - workload appears uneven",
+                ))
 
         # No assignees
-        unassigned = [a for a in ctx['in_progress_actions'] + ctx['todo_actions'] if not a['assignee']]
-        if unassigned:
-            recommendations.append({
-                'priority': 'medium',
-                'text': f"Assign owners to {len(unassigned)} unassigned tasks"
-            })
+        if ctx['open_unassigned_count']:
+            recommendations.append((
+                PRIORITY_MEDIUM,
+                f"Assign owners to {ctx['open_unassigned_count']} unassigned tasks",
+            ))
 
         # Missing due dates
-        no_due_date = [a for a in ctx['todo_actions'] + ctx['in_progress_actions'] if not a['due_date']]
-        if len(no_due_date) > ctx['total_actions'] * 0.3:
-            recommendations.append({
-                'priority': 'low',
-                'text': "Add due dates to more tasks for better timeline visibility"
-            })
+        if ctx['open_undated_count'] > ctx['total_actions'] * 0.3:
+            recommendations.append((
+                PRIORITY_LOW,
+                "Add due dates to more tasks for better timeline visibility",
+            ))
 
         if not recommendations:
-            response += "✅ **This path is well-organized!**\n\n"
-            response += "No major improvements needed. Keep up the good work!"
-            return response
+            parts.append("✅ **This path is well-organized!**\n\n")
+            parts.append("No major improvements needed. Keep up the good work!")
+            return ''.join(parts)
 
-        # Sort by priority
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        recommendations.sort(key=lambda x: priority_order[x['priority']])
+        # Sort by priority; the sort is stable, so equal priorities keep their order
+        recommendations.sort(key=itemgetter(0))
 
-        for rec in recommendations:
-            emoji = "🔴" if rec['priority'] == 'high' else "🟡" if rec['priority'] == 'medium' else "🟢"
-            response += f"{emoji} {rec['text']}\n\n"
+        parts.extend(f"{_PRIORITY_EMOJI[priority]} {text}\n\n" for priority, text in recommendations)
 
-        return response
+        return ''.join(parts)
 
     def _response_on_hold(self, path, ctx):
         """Generate on-hold information response."""
-        response = "⏸️ **On Hold Information**\n\n"
+        parts = ["⏸️ **On Hold Information**\n\n"]
 
         if path.status != 'on_hold':
-            response += f"This path is currently **{path.status.replace('_', ' ').title()}**, not on hold.\n"
+            parts.append(f"This path is currently **{path.status.replace('_', ' ').title()}**, not on hold.\n")
             if path.paused_at:
-                response += f"\nLast paused: {path.paused_at.strftime('%B %d, %Y')}"
-            return response
+                parts.append(f"\nLast paused: {path.paused_at.strftime('%B %d, %Y')}")
+            return ''.join(parts)
 
         if path.paused_at:
-            response += f"**Paused on:** {path.paused_at.strftime('%B %d, %Y')}\n\n"
+            parts.append(f"**Paused on:** {path.paused_at.strftime('%B %d, %Y')}\n\n")
 
         if path.on_hold_reason:
-            response += f"**Reason:**\n{path.on_hold_reason}\n\n"
+            parts.append(f"**Reason:**\n{path.on_hold_reason}\n\n")
 
         if path.what_was_started:
-            response += f"**What was started:**\n{path.what_was_started}\n\n"
+            parts.append(f"**What was started:**\n{path.what_was_started}\n\n")
 
         if path.on_hold_issues_faced:
-            response += f"**Issues faced:**\n{path.on_hold_issues_faced}\n\n"
+            parts.append(f"**Issues faced:**\n{path.on_hold_issues_faced}\n\n")
 
-        response += f"**Progress at pause:** {path.progress_percentage}% ({ctx['completed_actions']}/{ctx['total_actions']} tasks)"
+        parts.append(f"**Progress at pause:** {path.progress_percentage}% ({ctx['completed_actions']}/{ctx['total_actions']} tasks)")
 
-        return response
+        return ''.join(parts)
 
     def _response_learnings(self, path, ctx):
         """Generate learnings and insights response."""
-        response = "📚 **Learnings & Insights**\n\n"
+        parts = ["📚 **Learnings & Insights**\n\n"]
 
         if path.key_learnings:
-            response += "**Key Learnings:**\n"
+            parts.append("**Key Learnings:**\n")
             for item in path.key_learnings:
-                response += f"• {item}\n"
-            response += "\n"
+                parts.append(f"• {item}\n")
+            parts.append("\n")
 
         if path.completed_issues_faced:
-            response += "**Challenges Overcome:**\n"
+            parts.append("**Challenges Overcome:**\n")
             for item in path.completed_issues_faced:
-                response += f"• {item}\n"
-            response += "\n"
+                parts.append(f"• {item}\n")
+            parts.append("\n")
 
         if not path.key_learnings and not path.completed_issues_faced:
-            response += "No learnings have been documented yet.\n\n"
+            parts.append("No learnings have been documented yet.\n\n")
 
             # Provide insights based on data
-            if ctx['blocked_actions']:
-                response += f"💡 **Current insight:** {len(ctx['blocked_actions'])} blocked items might reveal process bottlenecks.\n"
+            if ctx['blocked_count']:
+                parts.append(f"💡 **Current insight:** {ctx['blocked_count']} blocked items might reveal process bottlenecks.\n")
             if ctx['completed_phases'] > 0:
-                response += f"💡 **Progress insight:** {ctx['completed_phases']} completed phases show good execution.\n"
+                parts.append(f"💡 **Progress insight:** {ctx['completed_phases']} completed phases show good execution.\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_full_summary(self, path, ctx):
         """Generate a comprehensive summary response."""
-        response = f"📋 **Complete Summary: {path.title}**\n\n"
+        parts = [f"📋 **Complete Summary: {path.title}**\n\n"]
 
         # Status
-        response += f"**Status:** {path.status.replace('_', ' ').title()} | **Progress:** {path.progress_percentage}%\n\n"
+        parts.append(f"**Status:** {path.status.replace('_', ' ').title()} | **Progress:** {path.progress_percentage}%\n\n")
 
         # Goal
         if path.goal_statement:
-            response += f"**Goal:** {path.goal_statement[:200]}{'...' if len(path.goal_statement) > 200 else ''}\n\n"
+            parts.append(f"**Goal:** {_ellipsize(path.goal_statement, 200)}\n\n")
 
         # Origin
         if path.issue:
-            response += f"**Issue:** {path.issue.title}\n"
+            parts.append(f"**Issue:** {path.issue.title}\n")
         if path.root_cause:
-            response += f"**Root Cause:** {path.root_cause.title}\n"
+            parts.append(f"**Root Cause:** {path.root_cause.title}\n")
         if path.initiative:
-            response += f"**Initiative:** {path.initiative.title}\n"
-        response += "\n"
+            parts.append(f"**Initiative:** {path.initiative.title}\n")
+        parts.append("\n")
 
         # Progress
-        response += f"**Tasks:** {ctx['completed_actions']}/{ctx['total_actions']} done"
-        if ctx['blocked_actions']:
-            response += f", {len(ctx['blocked_actions'])} blocked"
-        response += "\n"
+        parts.append(f"**Tasks:** {ctx['completed_actions']}/{ctx['total_actions']} done")
+        if ctx['blocked_count']:
+            parts.append(f", {ctx['blocked_count']} blocked")
+        parts.append("\n")
 
-        response += f"**Phases:** {ctx['completed_phases']}/{len(ctx['phases'])} complete\n"
-        response += f"**Team:** {len(ctx['all_assignees'])} members\n\n"
+        parts.append(f"**Phases:** {ctx['completed_phases']}/{ctx['phase_count']} complete\n")
+        parts.append(f"**Team:** {ctx['assignee_count']} members\n\n")
 
         # Timeline
         if path.started_at:
-            response += f"**Started:** {path.started_at.strftime('%b %d, %Y')}\n"
+            parts.append(f"**Started:** {path.started_at.strftime('%b %d, %Y')}\n")
         if path.target_completion_date:
-            response += f"**Target:** {path.target_completion_date.strftime('%b %d, %Y')}\n"
+            parts.append(f"**Target:** {path.target_completion_date.strftime('%b %d, %Y')}\n")
 
-        return response
+        return ''.join(parts)
 
     def _response_default(self, path, ctx):
         """Generate default response with helpful suggestions."""
-        response = f"🥔 **{path.title}**\n\n"
+        parts = [f"🥔 **{path.title}**\n\n"]
 
         if path.project_summary:
-            response += f"{path.project_summary[:300]}{'...' if len(path.project_summary) > 300 else ''}\n\n"
+            parts.append(f"{_ellipsize(path.project_summary, 300)}\n\n")
+
+        parts.append(f"**Status:** {path.status.replace('_', ' ').title()}\n")
+        parts.append(f"**Progress:** {path.progress_percentage}% ({ctx['completed_actions']}/{ctx['total_actions']} tasks)\n")
+        parts.append(f"**Team:** {ctx['assignee_count']} members\n\n")
 
-        response += f"**Status:** {path.status.replace('_', ' ').title()}\n"
-        response += f"**Progress:** {path.progress_percentage}% ({ctx['completed_actions']}/{ctx['total_actions']} tasks)\n"
-        response += f"**Team:** {len(ctx['all_assignees'])} members\n\n"
+        parts.append(AI_DEFAULT_FOOTER)
 
-        response += "💡 **Ask me about:**\n"
-        response += "• Status & progress\n"
-        response += "• Blockers & risks\n"
-        response += "• Deadlines & timeline\n"
-        response += "• Team & workload\n"
-        response += "• Phases & steps\n"
-        response += "• Goal & purpose\n"
-        response += "• Issue & root cause\n"
-        response += "• Accomplishments\n"
-        response += "• Recommendations\n"
-        response += "• Full summary"
+        return ''.join(parts)
 
-        return response
 
+# Spacing between sibling ``order`` values, so most moves fit between two neighbours
+ORDER_GAP = 1024
 
-class PhaseViewSet(viewsets.ModelViewSet):
+
+class MoveMixin:
+    """
+    Adds a ``move`` action that repositions an object among its siblings.
+
+    Moves usually write only the moved row, taking the midpoint of the neighbouring
+    ``order`` values. Siblings are renumbered (in one bulk UPDATE) only when the
+    neighbours leave no gap, e.g. for rows that were created with the default order.
+    """
+    move_parent_field = None
+    # Lookup from Path to the parent, to bump the path's updated_at after a move
+    move_path_lookup = None
+
+    @action(detail=True, methods=['post'])
+    def move(self, request, pk=None):
+        """Move the object after the ``after`` sibling, or to the top when it is null."""
+        obj = self.get_object()
+        serializer = MoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        after = serializer.validated_data.get('after')
+
+        model = type(obj)
+        parent_id = getattr(obj, f'{self.move_parent_field}_id')
+        siblings = list(
+            model.objects.filter(**{f'{self.move_parent_field}_id': parent_id})
+            .exclude(pk=obj.pk)
+            .order_by('order', 'created_at')
+            .values_list('pk', 'order')
+        )
+
+        index = 0
+        if after is not None:
+            sibling_ids = [sibling_id for sibling_id, _ in siblings]
+            if after not in sibling_ids:
+                return Response(
+                    {'after': ['Must be a sibling of the moved object.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            index = sibling_ids.index(after) + 1
+
+        low = siblings[index - 1][1] if index > 0 else -1
+        high = siblings[index][1] if index < len(siblings) else None
+
+        if high is None:
+            obj.order = low + ORDER_GAP if low >= 0 else ORDER_GAP
+            model.objects.filter(pk=obj.pk).update(order=obj.order)
+        elif high - low >= 2:
+            obj.order = (low + high) // 2
+            model.objects.filter(pk=obj.pk).update(order=obj.order)
+        else:
+            ordered_ids = [sibling_id for sibling_id, _ in siblings]
+            ordered_ids.insert(index, obj.pk)
+            model.objects.bulk_update(
+                [model(pk=sibling_id, order=(i + 1) * ORDER_GAP) for i, sibling_id in enumerate(ordered_ids)],
+                ['order'],
+            )
+            obj.order = (index + 1) * ORDER_GAP
+
+        # The writes above skip the model signals that normally touch the path
+        touch_paths(Path.objects.filter(**{self.move_path_lookup: parent_id}))
+        return Response(self.get_serializer(obj).data)
+
+
+class PhaseViewSet(ListQuerysetMixin, MoveMixin, viewsets.ModelViewSet):
     """API endpoint for Phases."""
+    move_parent_field = 'path'
+    move_path_lookup = 'pk'
     queryset = Phase.objects.select_related('path').prefetch_related('steps__action_items')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    list_queryset = Phase.objects.only(
+        'id', 'title', 'status', 'order', 'priority', 'category',
+        'workload_days', 'assignee_name', 'due_date',
+    ).prefetch_related('steps__action_items')
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['path', 'status']
     search_fields = ['title', 'description']
     ordering = ['order', 'created_at']
@@ -936,21 +1305,26 @@ class PhaseViewSet(viewsets.ModelViewSet):
         return PhaseSerializer
 
 
-class StepViewSet(viewsets.ModelViewSet):
+class StepViewSet(MoveMixin, viewsets.ModelViewSet):
     """API endpoint for Steps."""
+    move_parent_field = 'phase'
+    move_path_lookup = 'phases__id'
     queryset = Step.objects.select_related('phase', 'phase__path').prefetch_related('action_items')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['phase', 'status']
     search_fields = ['title', 'description']
     ordering = ['order', 'created_at']
     serializer_class = StepSerializer
 
 
-class ActionItemViewSet(viewsets.ModelViewSet):
+class ActionItemViewSet(MoveMixin, viewsets.ModelViewSet):
     """API endpoint for Action Items."""
-    queryset = ActionItem.objects.select_related('step', 'step__phase', 'step__phase__path')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['step', 'status', 'assignee_id']
+    move_parent_field = 'step'
+    move_path_lookup = 'phases__steps__id'
+    # ActionItemSerializer renders the step as its id, so no related rows are joined
+    queryset = ActionItem.objects.all()
+    filter_backends = [FilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_class = ActionItemFilter
     search_fields = ['title', 'description']
     ordering = ['order', 'created_at']
     serializer_class = ActionItemSerializer
@@ -965,7 +1339,8 @@ class ActionItemViewSet(viewsets.ModelViewSet):
         else:
             item.status = ItemStatus.DONE
             item.completed_at = timezone.now()
-        item.save()
+        # The progress counters follow through the post_save signal
+        item.save(update_fields=['status', 'completed_at', 'updated_at'])
         return Response(ActionItemSerializer(item).data)
 
     @action(detail=True, methods=['post'])
@@ -980,14 +1355,54 @@ class ActionItemViewSet(viewsets.ModelViewSet):
             item.completed_at = timezone.now()
         else:
             item.completed_at = None
-        item.save()
+        item.save(update_fields=['status', 'completed_at', 'updated_at'])
         return Response(ActionItemSerializer(item).data)
 
+    @action(detail=False, methods=['post'])
+    def bulk_update_status(self, request):
+        """
+        Update the status of many action items.
+
+        One UPDATE per target status, then a single recount of every touched path,
+        instead of a save and a progress update per item.
+        """
+        serializer = ActionItemBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ids_by_status = defaultdict(list)
+        for entry in serializer.validated_data['items']:
+            ids_by_status[entry['status']].append(entry['id'])
+        ids = [item_id for item_ids in ids_by_status.values() for item_id in item_ids]
+
+        now = timezone.now()
+        updated = 0
+        with transaction.atomic():
+            # Lock the rows so none is deleted between the check and the writes
+            found = set(ActionItem.objects.select_for_update().filter(pk__in=ids).values_list('pk', flat=True))
+            missing = set(ids) - found
+            if missing:
+                return Response(
+                    {'items': [f'Unknown action items: {", ".join(sorted(str(item_id) for item_id in missing))}.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            for new_status, item_ids in ids_by_status.items():
+                updated += ActionItem.objects.filter(pk__in=item_ids).update(
+                    status=new_status,
+                    completed_at=now if new_status == ItemStatus.DONE else None,
+                    updated_at=now,
+                )
+            # queryset.update() bypasses the progress signals
+            Path.recompute_progress_bulk(Path.objects.filter(phases__steps__action_items__id__in=ids).values('pk'))
+        bump_library_stats_version()
+        return Response({'updated': updated})
+
 
 class PathCommentViewSet(viewsets.ModelViewSet):
     """API endpoint for Path Comments."""
-    queryset = PathComment.objects.select_related('path')
+    # PathCommentSerializer renders the path as its id, so the path row is not joined
+    queryset = PathComment.objects.all()
     serializer_class = PathCommentSerializer
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filter_backends = [FilterBackend, filters.OrderingFilter]
     filterset_fields = ['path', 'author_id']
     ordering = ['-created_at']